@@ -90,7 +90,7 @@ class AbstractABC(Base, ABC):
 
         cls.model_config["ignored_types"] = ignored_types
 
-        cls._logger.debug(f"Ignored types for {cls.__name__}: {ignored_types}")
+        cls._logger.debug("Ignored types for %s: %s", cls.__name__, ignored_types)
 
     # ....................... #
 
@@ -101,14 +101,21 @@ class AbstractABC(Base, ABC):
         """
 
         parents = inspect.getmro(cls)[1:]
-        cfgs = []
-
-        for p in parents:
-            if hasattr(p, "_registry") and hasattr(p, "configs"):
-                cfgs = p.configs
-                break
+        cfgs = next(
+            (
+                p.configs
+                for p in parents
+                if hasattr(p, "_registry") and hasattr(p, "configs")
+            ),
+            [],
+        )
 
-        cls._logger.debug(f"Parent configs for {cls.__name__}: {list(map(type, cfgs))}")
+        if cls._logger.isEnabledFor(logging.DEBUG):
+            cls._logger.debug(
+                "Parent configs for %s: %s",
+                cls.__name__,
+                list(map(type, cfgs)),
+            )
 
         deduplicated = dict()
 
@@ -134,9 +141,9 @@ class AbstractABC(Base, ABC):
                 merge = c
                 merged.append(c)
 
-            cls._logger.debug(f"Self: {c}")
-            cls._logger.debug(f"Parent: {old}")
-            cls._logger.debug(f"Merge: {merge}")
+            cls._logger.debug("Self: %s", c)
+            cls._logger.debug("Parent: %s", old)
+            cls._logger.debug("Merge: %s", merge)
 
         cls.configs = merged
 
@@ -144,20 +151,24 @@ class AbstractABC(Base, ABC):
 
     @classmethod
     def _merge_registry_helper(cls: Type[A], d1: dict, d2: dict) -> dict:
-        for k in d2.keys():
-            if k in d1:
-                if isinstance(d1[k], dict) and isinstance(d2[k], dict):
-                    cls._merge_registry_helper(d1[k], d2[k])
+        debug = cls._logger.isEnabledFor(logging.DEBUG)
+        stack = [(d1, d2)]
+
+        while stack:
+            a, b = stack.pop()
+
+            for k, v in b.items():
+                if isinstance(v, dict) and isinstance(a.get(k), dict):
+                    stack.append((a[k], v))
+                    continue
 
-                else:
-                    d1[k] = d2[k]
+                if debug:
+                    action = "Overwriting" if k in a else "Adding"
                     cls._logger.debug(
-                        f"Overwriting {k} in registry: {d1[k]} -> {d2[k]}"
+                        "%s %s in registry: %s -> %s", action, k, a.get(k), v
                     )
 
-            else:
-                d1[k] = d2[k]
-                cls._logger.debug(f"Adding {k} in registry: {d1[k]} -> {d2[k]}")
+                a[k] = v
 
         return d1
 
@@ -166,14 +177,13 @@ class AbstractABC(Base, ABC):
     @classmethod
     def _merge_registry(cls: Type[A]):
         parents = inspect.getmro(cls)[1:]
-        reg = dict()
-
-        for p in parents:
-            if hasattr(p, "_registry"):
-                reg = p._registry
+        reg = next(
+            (p._registry for p in reversed(parents) if hasattr(p, "_registry")),
+            dict(),
+        )
 
-        cls._logger.debug(f"Parent registry for {cls.__name__}: {reg}")
-        cls._logger.debug(f"Self registry for {cls.__name__}: {cls._registry}")
+        cls._logger.debug("Parent registry for %s: %s", cls.__name__, reg)
+        cls._logger.debug("Self registry for %s: %s", cls.__name__, cls._registry)
 
         cls._registry = cls._merge_registry_helper(reg, cls._registry)
 
@@ -230,7 +240,7 @@ class AbstractSingleABC(Base, ABC):
             ignored_types += (tx,)
 
         cls.model_config["ignored_types"] = ignored_types
-        cls._logger.debug(f"Ignored types for {cls.__name__}: {ignored_types}")
+        cls._logger.debug("Ignored types for %s: %s", cls.__name__, ignored_types)
 
     # ....................... #
 
@@ -239,31 +249,34 @@ class AbstractSingleABC(Base, ABC):
         """Merge configurations for the subclass"""
 
         parents = inspect.getmro(cls)[1:]
-        parent_config = None
-        parent_selected = None
-
-        for p in parents:
-            if hasattr(p, "config") and issubclass(type(p.config), ConfigABC):
-                parent_config = p.config
-                parent_selected = p
-                break
+        parent_selected = next(
+            (
+                p
+                for p in parents
+                if hasattr(p, "config") and issubclass(type(p.config), ConfigABC)
+            ),
+            None,
+        )
+        parent_config = getattr(parent_selected, "config", None)
 
         if parent_config is None or parent_selected is None:
-            cls._logger.debug(f"Parent config for `{cls.__name__}` not found")
+            cls._logger.debug("Parent config for `%s` not found", cls.__name__)
             return
 
         if cls.config is not None:
             merged_config = cls.config.merge(parent_config)
             cls._logger.debug(
-                f"Merge config: `{parent_selected.__name__}` -> `{cls.__name__}`"
+                "Merge config: `%s` -> `%s`",
+                parent_selected.__name__,
+                cls.__name__,
             )
 
         else:
             merged_config = parent_config
-            cls._logger.debug(f"Use parent config: `{parent_selected.__name__}`")
+            cls._logger.debug("Use parent config: `%s`", parent_selected.__name__)
 
         cls.config = merged_config
-        cls._logger.debug(f"Final config for `{cls.__name__}`: {merged_config}")
+        cls._logger.debug("Final config for `%s`: %s", cls.__name__, merged_config)
 
     # ....................... #
 
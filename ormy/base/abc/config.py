@@ -1,5 +1,6 @@
 from abc import ABC, abstractmethod
-from typing import Self, TypeVar
+from functools import cache
+from typing import Any, Dict, Self, Tuple, Type, TypeVar
 
 from pydantic import ConfigDict
 
@@ -27,25 +28,32 @@ class ConfigABC(Base, ABC):
 
     # ....................... #
 
+    @classmethod
+    @cache
+    def _field_defaults(cls: Type[C]) -> Dict[str, Tuple[bool, Any]]:
+        """
+        Map of field names to their `(required, default)` pairs, computed once per class
+        """
+
+        return {
+            name: (field.is_required(), field.default)
+            for name, field in cls.model_fields.items()
+        }
+
+    # ....................... #
+
     def _default_helper(self: Self, *fields: str) -> bool:
         """
         Helper function to check if a field has default value
         """
 
+        defaults = self._field_defaults()
+
         for field in fields:
-            if field not in self.model_fields.keys():
+            if field not in defaults:
                 raise ValueError(f"Field {field} not found in model")
 
-            required = getattr(
-                self.model_fields[field],
-                "required",
-                False,
-            )
-            default = getattr(
-                self.model_fields[field],
-                "default",
-                None,
-            )
+            required, default = defaults[field]
 
             if required or (getattr(self, field) != default):
                 return False
@@ -61,14 +69,17 @@ class ConfigABC(Base, ABC):
 
         vals = {}
 
-        for field in self.model_fields.keys():
-            if not self._default_helper(field):
-                vals[field] = getattr(self, field)
+        for field, (required, default) in self._field_defaults().items():
+            value = getattr(self, field)
+
+            if required or value != default:
+                vals[field] = value
 
             else:
                 vals[field] = getattr(other, field)
 
-        return self.model_validate(vals)
+        # Values are taken from already validated configs
+        return self.model_construct(**vals)
 
     # ....................... #
 
@@ -1,10 +1,13 @@
+import asyncio
+from functools import singledispatch
 from abc import abstractmethod
-from typing import Any, Optional, Type, TypeVar
+from typing import Any, ClassVar, Dict, FrozenSet, List, Optional, Tuple, Type, TypeVar
 
 from pydantic import Field
 
 from ormy.base.func import hex_uuid4
 from ormy.base.logging import LogManager
+from ormy.base.pydantic import Base
 
 from .abstract import AbstractABC, AbstractSingleABC
 from .config import ConfigABC
@@ -15,13 +18,288 @@ from .typing import AbstractData, DocumentID
 D = TypeVar("D", bound="DocumentABC")
 C = TypeVar("C", bound="ConfigABC")
 Ds = TypeVar("Ds", bound="DocumentSingleABC")
+Dw = TypeVar("Dw", bound="_DocumentWriteMixin")
 
 logger = LogManager.get_logger(__name__)
 
 # ----------------------- #
 
 
-class DocumentABC(AbstractABC):
+@singledispatch
+def _normalize_update_data(data: AbstractData) -> Dict[str, Any]:
+    """
+    Normalize update data to a dictionary of field values
+
+    Args:
+        data (AbstractData): Model instance or dictionary
+
+    Returns:
+        data (Dict[str, Any]): Field values
+    """
+
+    # Raw values are only safe to reuse when they dump to themselves
+    if isinstance(data, Base) and type(data)._has_plain_fields():
+        return data.__dict__
+
+    return data.model_dump()
+
+
+@_normalize_update_data.register(dict)
+def _(data: Dict[str, Any]) -> Dict[str, Any]:
+    return data
+
+
+# ....................... #
+
+
+def _merge_bulk_updates(
+    items: List[Tuple[DocumentID, AbstractData]],
+    ignore_none: bool,
+) -> Dict[DocumentID, Dict[str, Any]]:
+    """
+    Merge update data by document ID, later values win
+
+    Args:
+        items (List[Tuple[DocumentID, AbstractData]]): Pairs of document ID and data
+        ignore_none (bool): Ignore None values
+
+    Returns:
+        merged (Dict[DocumentID, Dict[str, Any]]): Merged field values by document ID
+    """
+
+    merged: Dict[DocumentID, Dict[str, Any]] = {}
+
+    for id_, data in items:
+        values = _normalize_update_data(data)
+
+        if ignore_none:
+            values = {k: v for k, v in values.items() if v is not None}
+
+        merged.setdefault(id_, {}).update(values)
+
+    return merged
+
+
+# ----------------------- #
+
+
+class _DocumentWriteMixin(Base):
+    """
+    Storage dumps, partial and bulk updates shared by document ABCs
+    """
+
+    _field_names: ClassVar[FrozenSet[str]] = frozenset()
+    _supports_partial_update: ClassVar[bool] = False
+
+    # ....................... #
+
+    @classmethod
+    def __pydantic_init_subclass__(cls: Type[Dw], **kwargs):
+        """Cache model field names once the subclass is fully built"""
+
+        super().__pydantic_init_subclass__(**kwargs)
+
+        cls._field_names = frozenset(cls.model_fields.keys())
+
+    # ....................... #
+
+    def _to_storage(self: Dw) -> Dict[str, Any]:
+        """
+        Dump the document for storage, copying raw field values for plain models
+
+        Returns:
+            document (Dict[str, Any]): Document data
+        """
+
+        if type(self)._has_plain_fields():
+            return dict(self.__dict__)
+
+        return self.model_dump()
+
+    # ....................... #
+
+    @classmethod
+    def _partial_update_data(
+        cls: Type[Dw],
+        data: AbstractData,
+        ignore_none: bool = True,
+    ) -> Optional[Dict[str, Any]]:
+        """
+        Validate field updates and dump them in storage format for a partial write
+
+        Args:
+            data (AbstractData): Data to update the document with
+            ignore_none (bool): Ignore None values
+
+        Returns:
+            updates (Dict[str, Any] | None): Dumped updates or None if the update changes
+                the document ID or the model has validators needing the whole document
+        """
+
+        # Validators may read other fields, they need the whole stored document
+        if cls._has_validators():
+            return None
+
+        data = _normalize_update_data(data)
+
+        updates = {
+            k: v
+            for k, v in data.items()
+            if k in cls._field_names and not (v is None and ignore_none)
+        }
+
+        if "id" in updates:
+            return None
+
+        # Without validators, assignment checks only the assigned fields
+        probe = cls.model_construct()
+
+        for k, v in updates.items():
+            setattr(probe, k, v)
+
+        return probe.model_dump(include=set(updates))
+
+    # ....................... #
+
+    @classmethod
+    def _partial_update(
+        cls: Type[Dw],
+        id_: DocumentID,
+        updates: Dict[str, Any],
+    ) -> Optional[Dw]:
+        """
+        Apply dumped field updates to the stored document.
+        Backends with a native partial write override this and set `_supports_partial_update`,
+        the default fetches, updates and saves the whole document
+
+        Args:
+            id_ (DocumentID): ID of the document to update
+            updates (Dict[str, Any]): Dumped field updates
+
+        Returns:
+            res (Dw | None): Updated document or None if not found
+        """
+
+        instance = cls.find(id_)  # type: ignore[attr-defined]
+
+        if instance:
+            return instance.update(updates, ignore_none=False)
+
+        return None
+
+    # ....................... #
+
+    @classmethod
+    async def _apartial_update(
+        cls: Type[Dw],
+        id_: DocumentID,
+        updates: Dict[str, Any],
+    ) -> Optional[Dw]:
+        """
+        Apply dumped field updates to the stored document in asyncronous mode.
+        Backends with a native partial write override this and set `_supports_partial_update`,
+        the default fetches, updates and saves the whole document
+
+        Args:
+            id_ (DocumentID): ID of the document to update
+            updates (Dict[str, Any]): Dumped field updates
+
+        Returns:
+            res (Dw | None): Updated document or None if not found
+        """
+
+        instance = await cls.afind(id_)  # type: ignore[attr-defined]
+
+        if instance:
+            return await instance.aupdate(updates, ignore_none=False)
+
+        return None
+
+    # ....................... #
+
+    @classmethod
+    def bulk_update(
+        cls: Type[Dw],
+        items: List[Tuple[DocumentID, AbstractData]],
+        *args,
+        ignore_none: bool = True,
+        autosave: bool = True,
+        **kwargs,
+    ) -> List[Optional[Dw]]:
+        """
+        Update multiple documents with the given data.
+        Updates for the same document ID are merged in order, distinct documents are updated one after another
+
+        Args:
+            items (List[Tuple[DocumentID, AbstractData]]): Pairs of document ID and data to update the document with
+            ignore_none (bool): Ignore None values
+            autosave (bool): Save the documents after updating
+
+        Returns:
+            res (List[Optional[Dw]]): Updated documents or None for the ones not found, one per unique ID in input order
+        """
+
+        merged = _merge_bulk_updates(items, ignore_none)
+
+        return [
+            cls.update_by_id(  # type: ignore[attr-defined]
+                id_,
+                data,
+                *args,
+                ignore_none=ignore_none,
+                autosave=autosave,
+                **kwargs,
+            )
+            for id_, data in merged.items()
+        ]
+
+    # ....................... #
+
+    @classmethod
+    async def abulk_update(
+        cls: Type[Dw],
+        items: List[Tuple[DocumentID, AbstractData]],
+        *args,
+        ignore_none: bool = True,
+        autosave: bool = True,
+        **kwargs,
+    ) -> List[Optional[Dw]]:
+        """
+        Update multiple documents with the given data in asyncronous mode.
+        Updates for the same document ID are merged in order, distinct documents are updated concurrently
+
+        Args:
+            items (List[Tuple[DocumentID, AbstractData]]): Pairs of document ID and data to update the document with
+            ignore_none (bool): Ignore None values
+            autosave (bool): Save the documents after updating
+
+        Returns:
+            res (List[Optional[Dw]]): Updated documents or None for the ones not found, one per unique ID in input order
+        """
+
+        merged = _merge_bulk_updates(items, ignore_none)
+
+        return list(
+            await asyncio.gather(
+                *(
+                    cls.aupdate_by_id(  # type: ignore[attr-defined]
+                        id_,
+                        data,
+                        *args,
+                        ignore_none=ignore_none,
+                        autosave=autosave,
+                        **kwargs,
+                    )
+                    for id_, data in merged.items()
+                )
+            )
+        )
+
+
+# ----------------------- #
+
+
+class DocumentABC(_DocumentWriteMixin, AbstractABC):
     """
     Abstract Base Class for Document-Oriented Object-Relational Mapping
     """
@@ -30,8 +308,6 @@ class DocumentABC(AbstractABC):
         default_factory=hex_uuid4,
     )
 
-    # ....................... #
-
     @classmethod
     @abstractmethod
     def create(cls: Type[D], data: D) -> D: ...
@@ -88,18 +364,18 @@ class DocumentABC(AbstractABC):
         ...
         """
 
-        if isinstance(data, dict):
-            keys = data.keys()
+        data = _normalize_update_data(data)
 
-        else:
-            keys = data.model_fields.keys()
-            data = data.model_dump()
+        keys = [k for k in data if k in self._field_names]
 
-        for k in keys:
-            val = data.get(k, None)
+        if ignore_none:
+            for k in keys:
+                if (val := data[k]) is not None:
+                    setattr(self, k, val)
 
-            if not (val is None and ignore_none) and hasattr(self, k):
-                setattr(self, k, val)
+        else:
+            for k in keys:
+                setattr(self, k, data[k])
 
         if autosave:
             return self.save()
@@ -120,18 +396,18 @@ class DocumentABC(AbstractABC):
         ...
         """
 
-        if isinstance(data, dict):
-            keys = data.keys()
+        data = _normalize_update_data(data)
 
-        else:
-            keys = data.model_fields.keys()
-            data = data.model_dump()
+        keys = [k for k in data if k in self._field_names]
 
-        for k in keys:
-            val = data.get(k, None)
+        if ignore_none:
+            for k in keys:
+                if (val := data[k]) is not None:
+                    setattr(self, k, val)
 
-            if not (val is None and ignore_none) and hasattr(self, k):
-                setattr(self, k, val)
+        else:
+            for k in keys:
+                setattr(self, k, data[k])
 
         if autosave:
             return await self.asave()
@@ -150,6 +426,11 @@ class DocumentABC(AbstractABC):
         autosave: bool = True,
         **kwargs,
     ) -> Optional[D]:
+        if autosave and cls._supports_partial_update:
+            updates = cls._partial_update_data(data, ignore_none=ignore_none)
+
+            if updates:
+                return cls._partial_update(id_, updates)
 
         instance = cls.find(id_)
 
@@ -176,6 +457,11 @@ class DocumentABC(AbstractABC):
         autosave: bool = True,
         **kwargs,
     ) -> Optional[D]:
+        if autosave and cls._supports_partial_update:
+            updates = cls._partial_update_data(data, ignore_none=ignore_none)
+
+            if updates:
+                return await cls._apartial_update(id_, updates)
 
         instance = await cls.afind(id_)
 
@@ -194,7 +480,7 @@ class DocumentABC(AbstractABC):
 # ----------------------- #
 
 
-class DocumentSingleABC(AbstractSingleABC):
+class DocumentSingleABC(_DocumentWriteMixin, AbstractSingleABC):
     """
     Abstract Base Class for Document-Oriented Object-Relational Mapping
     """
@@ -203,8 +489,6 @@ class DocumentSingleABC(AbstractSingleABC):
         default_factory=hex_uuid4,
     )
 
-    # ....................... #
-
     @classmethod
     @abstractmethod
     def create(cls: Type[Ds], data: Ds) -> Ds: ...
@@ -269,18 +553,18 @@ class DocumentSingleABC(AbstractSingleABC):
             self (Ds): Updated document
         """
 
-        if isinstance(data, dict):
-            keys = data.keys()
+        data = _normalize_update_data(data)
 
-        else:
-            keys = data.model_fields.keys()
-            data = data.model_dump()
+        keys = [k for k in data if k in self._field_names]
 
-        for k in keys:
-            val = data.get(k, None)
+        if ignore_none:
+            for k in keys:
+                if (val := data[k]) is not None:
+                    setattr(self, k, val)
 
-            if not (val is None and ignore_none) and hasattr(self, k):
-                setattr(self, k, val)
+        else:
+            for k in keys:
+                setattr(self, k, data[k])
 
         if autosave:
             return self.save()
@@ -309,18 +593,18 @@ class DocumentSingleABC(AbstractSingleABC):
             self (Ds): Updated document
         """
 
-        if isinstance(data, dict):
-            keys = data.keys()
+        data = _normalize_update_data(data)
 
-        else:
-            keys = data.model_fields.keys()
-            data = data.model_dump()
+        keys = [k for k in data if k in self._field_names]
 
-        for k in keys:
-            val = data.get(k, None)
+        if ignore_none:
+            for k in keys:
+                if (val := data[k]) is not None:
+                    setattr(self, k, val)
 
-            if not (val is None and ignore_none) and hasattr(self, k):
-                setattr(self, k, val)
+        else:
+            for k in keys:
+                setattr(self, k, data[k])
 
         if autosave:
             return await self.asave()
@@ -352,6 +636,12 @@ class DocumentSingleABC(AbstractSingleABC):
             res (Optional[Ds]): Updated document or None if not found
         """
 
+        if autosave and cls._supports_partial_update:
+            updates = cls._partial_update_data(data, ignore_none=ignore_none)
+
+            if updates:
+                return cls._partial_update(id_, updates)
+
         instance = cls.find(id_)
 
         if instance:
@@ -390,6 +680,12 @@ class DocumentSingleABC(AbstractSingleABC):
             res (Optional[Ds]): Updated document or None if not found
         """
 
+        if autosave and cls._supports_partial_update:
+            updates = cls._partial_update_data(data, ignore_none=ignore_none)
+
+            if updates:
+                return await cls._apartial_update(id_, updates)
+
         instance = await cls.afind(id_)
 
         if instance:
@@ -97,7 +97,7 @@ class ExtensionABC(Base, ABC):
 
         cls.model_config["ignored_types"] = ignored_types
 
-        cls._logger.debug(f"Ignored types for {cls.__name__}: {ignored_types}")
+        cls._logger.debug("Ignored types for %s: %s", cls.__name__, ignored_types)
 
     # ....................... #
 
@@ -106,20 +106,23 @@ class ExtensionABC(Base, ABC):
         """Merge configurations for the subclass"""
 
         parents = inspect.getmro(cls)[1:]
-        cfgs = []
-        parent_selected = None
-
-        for p in parents:
-            if hasattr(p, "extension_configs") and all(
-                issubclass(type(x), ConfigABC) for x in p.extension_configs
-            ):
-                cfgs = p.extension_configs
-                parent_selected = p
-                break
-
-        cls._logger.debug(
-            f"Parent configs from `{parent_selected.__name__ if parent_selected else None}`: {list(map(lambda x: type(x).__name__, cfgs))}"
+        parent_selected = next(
+            (
+                p
+                for p in parents
+                if hasattr(p, "extension_configs")
+                and all(issubclass(type(x), ConfigABC) for x in p.extension_configs)
+            ),
+            None,
         )
+        cfgs = getattr(parent_selected, "extension_configs", [])
+
+        if cls._logger.isEnabledFor(logging.DEBUG):
+            cls._logger.debug(
+                "Parent configs from `%s`: %s",
+                parent_selected.__name__ if parent_selected else None,
+                [type(x).__name__ for x in cfgs],
+            )
 
         deduplicated = dict()
 
@@ -121,9 +121,12 @@ class Registry:
 
             if not config.is_default():
                 logger.debug(
-                    f"Adding subclass {value} for `{type(config).__name__}` using discriminator: {keys}"
+                    "Adding subclass %s for `%s` using discriminator: %s",
+                    value,
+                    type(config).__name__,
+                    keys,
                 )
-                logger.debug(f"Registry before: {cls._registry}")
+                logger.debug("Registry before: %s", cls._registry)
 
                 current = cls._registry.get(type(config).__name__, {})
 
@@ -138,4 +141,4 @@ class Registry:
                 current[keys[-1]] = value
                 cls._registry[type(config).__name__] = root
 
-                logger.debug(f"Registry after: {cls._registry}")
+                logger.debug("Registry after: %s", cls._registry)
@@ -1,8 +1,10 @@
 import hashlib
-import json
+import secrets
 from datetime import UTC, datetime
 from typing import Optional
-from uuid import UUID, uuid4
+from uuid import UUID
+
+import orjson
 
 # ----------------------- #
 
@@ -56,11 +58,34 @@ def datetime_to_timestamp(dt: datetime) -> int:
 # Hash utils
 
 
+def _hash_payload(val: str | dict) -> bytes:
+    """
+    Encode a value to bytes for hashing.
+
+    Non-string values are serialized to JSON with sorted keys, so equal dicts produce equal payloads.
+
+    Args:
+        val (Any): The value to encode.
+
+    Returns:
+        bytes: The encoded value.
+    """
+
+    if isinstance(val, str):
+        return val.encode("utf-8")
+
+    return orjson.dumps(val, option=orjson.OPT_SORT_KEYS | orjson.OPT_NON_STR_KEYS)
+
+
+# ....................... #
+
+
 def hash_from_any(val: str | dict) -> str:
     """
     Calculate the MD5 hash of a given value.
 
-    If the value is not a string, it will be converted to a JSON string representation before hashing.
+    If the value is not a string, it will be converted to a JSON representation with sorted keys before hashing,
+    so the hash does not depend on dict insertion order.
 
     Args:
         val (Any): The value to calculate the hash for.
@@ -69,10 +94,7 @@ def hash_from_any(val: str | dict) -> str:
         str: The MD5 hash of the value.
     """
 
-    if not isinstance(val, str):
-        val = json.dumps(val)
-
-    hex_string = hashlib.md5(val.encode()).hexdigest()
+    hex_string = hashlib.md5(_hash_payload(val), usedforsecurity=False).hexdigest()
     return hex_string
 
 
@@ -108,4 +130,4 @@ def hex_uuid4(val: Optional[str] = None) -> str:
 
     """
 
-    return hex_uuid4_from_string(val) if val else uuid4().hex
+    return hex_uuid4_from_string(val) if val else secrets.token_hex(16)
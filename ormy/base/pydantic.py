@@ -1,6 +1,35 @@
-from typing import Any, ClassVar, Dict, List, Optional, Self, Type, TypeVar
-
-from pydantic import BaseModel, ConfigDict, Field, SecretStr, model_validator
+from collections.abc import Collection
+from functools import cache, lru_cache
+from types import UnionType
+from typing import (
+    Any,
+    ClassVar,
+    Dict,
+    List,
+    Optional,
+    Self,
+    Set,
+    Tuple,
+    Type,
+    TypeVar,
+    Union,
+    get_args,
+    get_origin,
+)
+
+from pydantic import (
+    AfterValidator,
+    BaseModel,
+    BeforeValidator,
+    ConfigDict,
+    Field,
+    PlainSerializer,
+    PlainValidator,
+    SecretStr,
+    WrapSerializer,
+    WrapValidator,
+    field_validator,
+)
 
 from .generic import TabularData
 
@@ -8,6 +37,25 @@ from .generic import TabularData
 
 T = TypeVar("T", bound="Base")
 
+# Keys kept in flat schema entries
+_SCHEMA_KEYS = ("key", "title", "type", "value")
+
+# Keys kept in reference schema entries
+_REFERENCE_KEYS = ("key", "title", "type")
+
+# Leaf types that can never hold a secret value
+_PLAIN_TYPES = frozenset({str, int, float, bool, bytes, type(None)})
+
+# `Annotated` field metadata that may change the dumped value
+_FIELD_HOOKS = (
+    AfterValidator,
+    BeforeValidator,
+    PlainValidator,
+    WrapValidator,
+    PlainSerializer,
+    WrapSerializer,
+)
+
 # ----------------------- #
 
 
@@ -48,14 +96,44 @@ class Base(BaseModel):
 
         for k, v in defs.items():
             if "enum" in v:
-                v["value"] = v["enum"]
-                v["type"] = "array"  # "enum"
-                extracted_defs[k] = v
+                extracted_defs[k] = {
+                    **v,
+                    "value": v["enum"],
+                    "type": "array",  # "enum"
+                }
 
         return extracted_defs
 
     # ....................... #
 
+    @classmethod
+    @cache
+    def _serialization_schema(cls: Type[T]) -> Dict[str, Any]:
+        """
+        Serialization JSON schema of the model, built once per class
+
+        Returns:
+            schema (Dict[str, Any]): The JSON schema
+        """
+
+        return cls.model_json_schema(mode="serialization")
+
+    # ....................... #
+
+    @classmethod
+    @cache
+    def _serialization_schema_defs(cls: Type[T]) -> Dict[str, dict]:
+        """
+        Definitions parsed from the serialization JSON schema, built once per class
+
+        Returns:
+            extracted_defs (Dict[str, dict]): The extracted definitions
+        """
+
+        return cls._parse_json_schema_defs(cls._serialization_schema())
+
+    # ....................... #
+
     @classmethod
     def model_flat_schema(
         cls: Type[T],
@@ -77,69 +155,86 @@ class Base(BaseModel):
             schema (List[Dict[str, Any]]): The flat schema for the model
         """
 
-        schema = cls.model_json_schema(mode="serialization")
-        defs = cls._parse_json_schema_defs(schema)
-        keys: List[str] = [k for k, _ in schema["properties"].items()]
+        schema = cls._serialization_schema()
+        defs = cls._serialization_schema_defs()
+        keys: Set[str] = set(schema["properties"])
         flat_schema: List[Dict[str, Any]] = []
-        schema_keys = ["key", "title", "type", "value"]
 
         if include is not None:
-            keys = include
+            keys = set(include)
 
         elif exclude is not None:
-            keys = [k for k in keys if k not in exclude]
+            keys -= set(exclude)
 
         for k, v in schema["properties"].items():
             if k not in keys:
                 continue
 
-            type_ = v.get("type", "string")
-
             # skip array of references
-            if type_ == "array":
-                if items := v.get("items", {}):
-                    if "$ref" in items.keys():
-                        continue
+            if v.get("type") == "array":
+                if (items := v.get("items")) and "$ref" in items:
+                    continue
 
             # check for reference
-            if refs := v.get("allOf", []):
+            if refs := v.get("allOf"):
                 if len(refs) > 1:
                     continue
 
-                ref_name = refs[0]["$ref"].split("/")[-1]
+                ref_name = refs[0]["$ref"].rpartition("/")[2]
 
                 # parse definitions, include only first level references
-                if ref := defs.get(ref_name, {}):
+                if ref := defs.get(ref_name):
                     data = {"key": k, **ref}
                     data["title"] = v.get("title", data.get("title", k.title()))
-                    data = {
-                        k: v
-                        for k, v in data.items()
-                        if k in schema_keys and v is not None
-                    }
+                    data = {x: data[x] for x in _SCHEMA_KEYS if data.get(x) is not None}
+                    data["type"] = cls._define_dtype(
+                        data["key"], data.get("type", None)
+                    )
                     flat_schema.append(data)
 
             # include not referenced fields
             else:
                 data = {"key": k, **v}
-                data = {
-                    k: v for k, v in data.items() if k in schema_keys and v is not None
-                }
+                data = {x: data[x] for x in _SCHEMA_KEYS if data.get(x) is not None}
+                data["type"] = cls._define_dtype(data["key"], data.get("type", None))
                 flat_schema.append(data)
 
-        # include extra based on extra definitions list
+        flat_schema.extend(cls._extra_flat_schema(extra, extra_definitions))
+
+        return flat_schema
+
+    # ....................... #
+
+    @classmethod
+    def _extra_flat_schema(
+        cls: Type[T],
+        extra: Optional[List[str]],
+        extra_definitions: List[Dict[str, Any]],
+    ) -> List[Dict[str, Any]]:
+        """
+        Select extra schema entries based on extra definitions list
+
+        Args:
+            extra (List[str], optional): The extra fields to include in the schema
+            extra_definitions (List[Dict[str, Any]]): The extra definitions
+
+        Returns:
+            schema (List[Dict[str, Any]]): The extra schema entries
+        """
+
+        res: List[Dict[str, Any]] = []
+
         if extra and extra_definitions:
             for ef in extra:
                 if exdef := next(
                     (x for x in extra_definitions if x["key"] == ef), None
                 ):
-                    flat_schema.append(exdef)
-
-        # follow up type definition from specific fields
-        for field in flat_schema:
-            field["type"] = cls._define_dtype(field["key"], field.get("type", None))
+                    exdef["type"] = cls._define_dtype(
+                        exdef["key"], exdef.get("type", None)
+                    )
+                    res.append(exdef)
 
-        return flat_schema
+        return res
 
     # ....................... #
 
@@ -165,16 +260,61 @@ class Base(BaseModel):
             schema (BaseReference): The reference schema for the model
         """
 
-        schema = cls.model_flat_schema(include, exclude, extra, extra_definitions)
+        schema = list(
+            cls._model_reference_schema(
+                tuple(include) if include is not None else None,
+                tuple(exclude) if exclude is not None else None,
+                tuple(extra) if extra is not None else None,
+                prefix,
+            )
+        )
+
+        # Extra definitions may hold unhashable values, so they are applied after the cache.
+        # Prefixed references drop extra fields
+        if not prefix:
+            schema.extend(cls._extra_flat_schema(extra, extra_definitions))
+
+        return BaseReference(table_schema=schema)
+
+    # ....................... #
+
+    @classmethod
+    @lru_cache(maxsize=256)
+    def _model_reference_schema(
+        cls: Type[T],
+        include: Optional[Tuple[str, ...]],
+        exclude: Optional[Tuple[str, ...]],
+        extra: Optional[Tuple[str, ...]],
+        prefix: str,
+    ) -> Tuple[Dict[str, Any], ...]:
+        """
+        Build the reference schema entries of model fields, cached per class and arguments
+
+        Args:
+            include (Tuple[str, ...], optional): The fields to include in the schema
+            exclude (Tuple[str, ...], optional): The fields to exclude from the schema
+            extra (Tuple[str, ...], optional): The extra fields, dropped from prefixed schema
+            prefix (str): The prefix for the field keys
+
+        Returns:
+            schema (Tuple[Dict[str, Any], ...]): The reference schema entries
+        """
+
+        schema = cls.model_flat_schema(
+            list(include) if include is not None else None,
+            list(exclude) if exclude is not None else None,
+        )
 
         if prefix:
+            extra_keys = set(extra or [])
+            pfx = f"{prefix}_"
             schema = [
-                {**s, "key": f"{prefix}_{s['key']}"}
+                dict(s, key=pfx + s["key"])
                 for s in schema
-                if s["key"] not in (extra or [])
+                if s["key"] not in extra_keys
             ]
 
-        return BaseReference(table_schema=schema)
+        return tuple(schema)
 
     # ....................... #
 
@@ -190,20 +330,143 @@ class Base(BaseModel):
             Any: The handled value
         """
 
+        if type(x) in _PLAIN_TYPES:
+            return x
+
         if isinstance(x, SecretStr):
             return x.get_secret_value()
 
-        elif isinstance(x, dict):
-            return {k: Base._handle_secret(v) for k, v in x.items()}
+        handle = Base._handle_secret
+
+        if isinstance(x, dict):
+            return {k: handle(v) for k, v in x.items()}
 
         elif isinstance(x, (list, set, tuple)):
-            return [Base._handle_secret(v) for v in x]
+            return [handle(v) for v in x]
 
         else:
             return x
 
     # ....................... #
 
+    @staticmethod
+    def _annotation_has_secrets(annotation: Any, seen: Set[type]) -> bool:
+        """
+        Check whether an annotation may hold a secret value
+
+        Args:
+            annotation (Any): The annotation to check
+            seen (Set[type]): The models already checked
+
+        Returns:
+            result (bool): Whether the annotation may hold a secret value
+        """
+
+        if annotation is Any or annotation is object:
+            return True
+
+        args = get_args(annotation)
+
+        # Unparametrized typing aliases, e.g. `typing.Dict`
+        if not args and (origin := get_origin(annotation)) is not None:
+            annotation = origin
+
+        if isinstance(annotation, type) and not args:
+            if issubclass(annotation, SecretStr):
+                return True
+
+            if issubclass(annotation, BaseModel):
+                if annotation in seen:
+                    return False
+
+                seen.add(annotation)
+
+                return any(
+                    Base._annotation_has_secrets(f.annotation, seen)
+                    for f in annotation.model_fields.values()
+                )
+
+            # Unparametrized containers may hold anything
+            return issubclass(annotation, Collection) and not issubclass(
+                annotation, (str, bytes, bytearray)
+            )
+
+        return any(Base._annotation_has_secrets(a, seen) for a in args)
+
+    # ....................... #
+
+    @classmethod
+    @cache
+    def _has_secrets(cls: Type[T]) -> bool:
+        """
+        Check whether the model may hold secret values, computed once per class
+
+        Returns:
+            result (bool): Whether the model may hold secret values
+        """
+
+        return cls._annotation_has_secrets(cls, set())
+
+    # ....................... #
+
+    @classmethod
+    @cache
+    def _has_plain_fields(cls: Type[T]) -> bool:
+        """
+        Check whether the model dumps to its raw field values, computed once per class
+
+        Returns:
+            result (bool): Whether all fields hold plain values with default serialization
+        """
+
+        if cls.model_config.get("extra") == "allow" or cls.model_computed_fields:
+            return False
+
+        decorators = cls.__pydantic_decorators__
+
+        if decorators.field_serializers or decorators.model_serializers:
+            return False
+
+        for field in cls.model_fields.values():
+            annotation = field.annotation
+
+            if get_origin(annotation) in (Union, UnionType):
+                args = get_args(annotation)
+
+            else:
+                args = (annotation,)
+
+            if field.exclude or not all(a in _PLAIN_TYPES for a in args):
+                return False
+
+            if any(isinstance(m, _FIELD_HOOKS) for m in field.metadata):
+                return False
+
+        return True
+
+    # ....................... #
+
+    @classmethod
+    @cache
+    def _has_validators(cls: Type[T]) -> bool:
+        """
+        Check whether the model defines field or model validators, computed once per class
+
+        Returns:
+            result (bool): Whether the model defines validators
+        """
+
+        decorators = cls.__pydantic_decorators__
+
+        return bool(
+            decorators.model_validators
+            or decorators.field_validators
+            or decorators.root_validators
+            or decorators.validators
+        )
+
+    # ....................... #
+
     def model_dump_with_secrets(self: Self) -> Dict[str, Any]:
         """
         Dump the model with secrets
@@ -214,6 +477,9 @@ class Base(BaseModel):
 
         res = self.model_dump()
 
+        if not type(self)._has_secrets():
+            return res
+
         for k, v in res.items():
             res[k] = self._handle_secret(v)
 
@@ -236,6 +502,10 @@ class Base(BaseModel):
             model (Base): The validated
         """
 
+        # Fast path for the most common input
+        if type(data) is dict:
+            return cls.model_validate(data)
+
         if isinstance(data, str):
             return cls.model_validate_json(data)
 
@@ -247,6 +517,26 @@ class Base(BaseModel):
 
     # ....................... #
 
+    @classmethod
+    @cache
+    def _specific_dtypes(cls: Type[T]) -> Dict[str, str]:
+        """
+        Reverse mapping of specific fields, built once per class
+
+        Returns:
+            dtypes (Dict[str, str]): The data type for each specific field
+        """
+
+        dtypes: Dict[str, str] = {}
+
+        for k, v in cls.specific_fields.items():
+            for field in v:
+                dtypes.setdefault(field, k)
+
+        return dtypes
+
+    # ....................... #
+
     @classmethod
     def _define_dtype(
         cls: Type[T],
@@ -264,9 +554,8 @@ class Base(BaseModel):
             type (str): The data type of the given key
         """
 
-        for k, v in cls.specific_fields.items():
-            if key in v:
-                return k
+        if (specific := cls._specific_dtypes().get(key)) is not None:
+            return specific
 
         if dtype is not None:
             return dtype
@@ -299,24 +588,21 @@ class BaseReference(BaseModel):
             schema (BaseReference): The merged reference
         """
 
+        keys = {f["key"] for f in self.table_schema}
+
         for sch in others:
-            keys = [f["key"] for f in self.table_schema]
             update = [x for x in sch.table_schema if x["key"] not in keys]
             self.table_schema.extend(update)
+            keys.update(x["key"] for x in update)
 
         return self
 
     # ....................... #
 
-    @model_validator(mode="before")
+    @field_validator("table_schema", mode="before")
     @classmethod
-    def filter_schema_fields(cls: Type[Br], v):
-        v["table_schema"] = [
-            {k: v for k, v in field.items() if k in ["key", "title", "type"]}
-            for field in v["table_schema"]
-        ]
-
-        return v
+    def filter_schema_fields(cls: Type[Br], v: List[Dict[str, Any]]):
+        return [{k: f[k] for k in _REFERENCE_KEYS if k in f} for f in v]
 
 
 # ----------------------- #
@@ -14,7 +14,7 @@ from meilisearch_python_sdk.models.settings import (
 )
 from meilisearch_python_sdk.models.settings import MeilisearchSettings as MsSettings
 from meilisearch_python_sdk.types import JsonDict
-from pydantic import SecretStr, model_validator
+from pydantic import NonNegativeFloat, PositiveInt, SecretStr, model_validator
 
 from ormy.base.abc import ConfigABC
 from ormy.base.error import InternalError
@@ -76,12 +76,14 @@ class MeilisearchCredentials(Base):
         host (str): Meilisearch host
         port (int, optional): Meilisearch port
         https (bool): Whether to use HTTPS
+        http2 (bool): Whether to use HTTP/2 connections, requires `h2` package
     """
 
     master_key: Optional[SecretStr] = None
     host: str = "localhost"
     port: Optional[int] = 7700
     https: bool = False
+    http2: bool = False
 
     # ....................... #
 
@@ -107,6 +109,8 @@ class MeilisearchConfig(ConfigABC):
         index (str): Meilisearch index name
         primary_key (str): Meilisearch primary key
         settings (MeilisearchSettings): Meilisearch settings
+        batch_size (int): Maximum number of documents or ids sent in a single request
+        debounce_sec (float): Delay to collect queued background updates into one request, 0 to disable
         include_to_registry (bool): Whether to include to registry
         log_level (ormy.utils.logging.LogLevel): Log level
         credentials (MeilisearchCredentials): Meilisearch connect credentials
@@ -117,6 +121,8 @@ class MeilisearchConfig(ConfigABC):
     index: str = "_default_"
     primary_key: str = "id"
     settings: MeilisearchSettings = MeilisearchSettings(searchable_attributes=["*"])
+    batch_size: PositiveInt = 1000
+    debounce_sec: NonNegativeFloat = 0.0
 
     # Global configuration
     credentials: MeilisearchCredentials = MeilisearchCredentials()
@@ -0,0 +1,691 @@
+import asyncio
+import threading
+import time
+from collections import deque
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from itertools import islice
+from typing import (
+    Any,
+    AsyncIterator,
+    Callable,
+    Coroutine,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Set,
+    Tuple,
+    Type,
+)
+from weakref import WeakKeyDictionary
+
+from meilisearch_python_sdk import AsyncClient, AsyncIndex, Client, Index
+from meilisearch_python_sdk.types import JsonDict
+from pydantic import BaseModel
+
+from ormy.base.typing import AsyncCallable
+
+from .config import MeilisearchConfig
+from .schema import SortOrder
+
+# ----------------------- #
+
+MeiliClientKey = Tuple[str, Optional[str], bool]
+
+# Headers shared by all Meilisearch clients, never mutated by the sdk
+_MEILI_HEADERS = {"Content-Type": "application/json"}
+
+# Seconds a Meilisearch health check result is reused
+MEILI_HEALTH_TTL = 5.0
+
+# Seconds a listing of existing Meilisearch indexes is reused
+MEILI_INDEXES_TTL = 5.0
+
+# Maximum number of concurrent Meilisearch requests
+MEILI_MAX_CONCURRENCY = 8
+
+# Rendered sort suffixes for each sort order
+MEILI_SORT_SUFFIX = {o: f":{o.value}" for o in SortOrder}
+
+# Shared clients keyed by (url, api key, http2), async ones are bound to their event loop
+_meili_clients: Dict[MeiliClientKey, Client] = {}
+_ameili_clients: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, Dict[MeiliClientKey, AsyncClient]
+] = WeakKeyDictionary()
+
+# Recent listings of existing index uids keyed by (url, api key, http2), as (listed at, uids)
+_meili_index_uids: Dict[MeiliClientKey, Tuple[float, Set[str]]] = {}
+
+# Recent health check results keyed by url, as (checked at, status)
+_meili_health_checks: Dict[str, Tuple[float, bool]] = {}
+
+# Strong references to fire-and-forget Meilisearch tasks until they finish
+_meili_background_tasks: Set[asyncio.Task] = set()
+
+# Guards lazy index initialization, one lock per class
+_meili_init_locks: Dict[type, threading.Lock] = {}
+
+# Queued documents awaiting a debounced update keyed by class, bound to their event loop
+_ameili_write_buffers: WeakKeyDictionary[
+    asyncio.AbstractEventLoop, Dict[type, List[Any]]
+] = WeakKeyDictionary()
+
+# ....................... #
+
+
+def meili_client_key(cfg: MeilisearchConfig) -> MeiliClientKey:
+    """
+    Get the key identifying Meilisearch clients for the configuration
+
+    Args:
+        cfg (MeilisearchConfig): Meilisearch configuration
+
+    Returns:
+        key (MeiliClientKey): Meilisearch URL, API key and HTTP/2 flag
+    """
+
+    key = cfg.credentials.master_key
+
+    if key:
+        api_key = key.get_secret_value()
+
+    else:
+        api_key = None
+
+    return cfg.url(), api_key, cfg.credentials.http2
+
+
+# ....................... #
+
+
+def meili_new_client(key: MeiliClientKey) -> Client:
+    """
+    Create a new syncronous Meilisearch client
+
+    Args:
+        key (MeiliClientKey): Meilisearch URL, API key and HTTP/2 flag
+
+    Returns:
+        client (meilisearch_python_sdk.Client): Syncronous Meilisearch client
+    """
+
+    url, api_key, http2 = key
+
+    return Client(
+        url=url,
+        api_key=api_key,
+        custom_headers=_MEILI_HEADERS,
+        http2=http2,
+    )
+
+
+# ....................... #
+
+
+def ameili_new_client(key: MeiliClientKey) -> AsyncClient:
+    """
+    Create a new asyncronous Meilisearch client
+
+    Args:
+        key (MeiliClientKey): Meilisearch URL, API key and HTTP/2 flag
+
+    Returns:
+        client (meilisearch_python_sdk.AsyncClient): Asyncronous Meilisearch client
+    """
+
+    url, api_key, http2 = key
+
+    return AsyncClient(
+        url=url,
+        api_key=api_key,
+        custom_headers=_MEILI_HEADERS,
+        http2=http2,
+    )
+
+
+# ....................... #
+
+
+def meili_shared_client(key: MeiliClientKey) -> Client:
+    """
+    Get syncronous Meilisearch client shared by all classes with the same key
+
+    Args:
+        key (MeiliClientKey): Meilisearch URL, API key and HTTP/2 flag
+
+    Returns:
+        client (meilisearch_python_sdk.Client): Syncronous Meilisearch client
+    """
+
+    c = _meili_clients.get(key)
+
+    if c is None:
+        c = _meili_clients.setdefault(key, meili_new_client(key))
+
+    return c
+
+
+# ....................... #
+
+
+def ameili_shared_client(key: MeiliClientKey) -> AsyncClient:
+    """
+    Get asyncronous Meilisearch client shared by all classes with the same key
+    for the running event loop
+
+    Args:
+        key (MeiliClientKey): Meilisearch URL, API key and HTTP/2 flag
+
+    Returns:
+        client (meilisearch_python_sdk.AsyncClient): Asyncronous Meilisearch client
+    """
+
+    clients = _ameili_clients.setdefault(asyncio.get_running_loop(), {})
+    c = clients.get(key)
+
+    # No await between lookup and insert, so coroutines cannot race here
+    if c is None:
+        c = clients[key] = ameili_new_client(key)
+
+    return c
+
+
+# ....................... #
+
+
+def meili_existing_indexes(c: Client, key: MeiliClientKey) -> Set[str]:
+    """
+    Get the uids of existing Meilisearch indexes, listings are reused for a few seconds per key
+
+    Args:
+        c (meilisearch_python_sdk.Client): Syncronous Meilisearch client
+        key (MeiliClientKey): Meilisearch URL, API key and HTTP/2 flag of the client
+
+    Returns:
+        uids (Set[str]): The uids of existing indexes
+    """
+
+    listed = _meili_index_uids.get(key)
+    now = time.monotonic()
+
+    if listed is not None and now - listed[0] < MEILI_INDEXES_TTL:
+        return listed[1]
+
+    uids: Set[str] = set()
+    offset = 0
+
+    while page := c.get_indexes(offset=offset, limit=1000):
+        uids.update(ix.uid for ix in page)
+        offset += len(page)
+
+    _meili_index_uids[key] = (now, uids)
+
+    return uids
+
+
+# ....................... #
+
+
+def meili_probe_health(c: Client) -> bool:
+    """
+    Request Meilisearch health
+
+    Args:
+        c (meilisearch_python_sdk.Client): Syncronous Meilisearch client
+
+    Returns:
+        status (bool): Whether Meilisearch is available
+    """
+
+    try:
+        h = c.health()
+        status = h.status == "available"
+
+    except Exception:
+        status = False
+
+    return status
+
+
+# ....................... #
+
+
+def meili_cached_health(url: str, probe: Callable[[], bool]) -> bool:
+    """
+    Check Meilisearch health, results are reused for a few seconds per url
+
+    Args:
+        url (str): Meilisearch URL
+        probe (Callable[[], bool]): The health request to run on a cache miss
+
+    Returns:
+        status (bool): Whether Meilisearch is available
+    """
+
+    checked = _meili_health_checks.get(url)
+    now = time.monotonic()
+
+    if checked is not None and now - checked[0] < MEILI_HEALTH_TTL:
+        return checked[1]
+
+    status = probe()
+    _meili_health_checks[url] = (now, status)
+
+    return status
+
+
+# ....................... #
+
+
+def meili_health_by_url(checks: Dict[str, Callable[[], bool]]) -> Dict[str, bool]:
+    """
+    Run health checks of several Meilisearch instances concurrently
+
+    Args:
+        checks (Dict[str, Callable[[], bool]]): The health check for each url
+
+    Returns:
+        statuses (Dict[str, bool]): Availability for each url
+    """
+
+    if not checks:
+        return {}
+
+    with ThreadPoolExecutor(max_workers=MEILI_MAX_CONCURRENCY) as executor:
+        statuses = executor.map(lambda check: check(), checks.values())
+
+        return dict(zip(checks, statuses))
+
+
+# ....................... #
+
+
+def meili_ensure_index(cls: Any) -> None:
+    """
+    Create or update the Meilisearch index of the class on its first use
+
+    Args:
+        cls (Any): Meilisearch extension class owning the index
+    """
+
+    if cls.__dict__.get("_meili_ready", False):
+        return
+
+    with _meili_init_locks.setdefault(cls, threading.Lock()):
+        if not cls.__dict__.get("_meili_ready", False):
+            cls._meili_safe_create_or_update()
+            cls._meili_ready = True
+
+
+# ....................... #
+
+
+async def ameili_ensure_index(cls: Any) -> None:
+    """
+    Create or update the Meilisearch index of the class on its first use in asyncronous mode
+
+    Args:
+        cls (Any): Meilisearch extension class owning the index
+    """
+
+    if not cls.__dict__.get("_meili_ready", False):
+        await asyncio.to_thread(meili_ensure_index, cls)
+
+
+# ....................... #
+
+
+def meili_ensure_indexes(classes: List[Any]) -> None:
+    """
+    Create or update Meilisearch indexes of several classes concurrently
+
+    Args:
+        classes (List[Any]): Meilisearch extension classes owning the indexes
+    """
+
+    with ThreadPoolExecutor(max_workers=MEILI_MAX_CONCURRENCY) as executor:
+        list(executor.map(meili_ensure_index, classes))
+
+
+# ....................... #
+
+
+async def ameili_ensure_indexes(classes: List[Any]) -> None:
+    """
+    Create or update Meilisearch indexes of several classes concurrently in asyncronous mode
+
+    Args:
+        classes (List[Any]): Meilisearch extension classes owning the indexes
+    """
+
+    await asyncio.gather(*(ameili_ensure_index(c) for c in classes))
+
+
+# ....................... #
+
+
+def meili_request_attributes(
+    cfg: MeilisearchConfig,
+) -> Tuple[FrozenSet[str], FrozenSet[str], bool]:
+    """
+    Get sortable and filterable attributes of the index settings as sets
+
+    Args:
+        cfg (MeilisearchConfig): Meilisearch configuration
+
+    Returns:
+        sortable (FrozenSet[str]): Sortable attributes
+        filterable (FrozenSet[str]): Filterable attributes
+        filter_all (bool): Whether all attributes are filterable
+    """
+
+    sortable = cfg.settings.sortable_attributes or []
+    filterable = cfg.settings.filterable_attributes or []
+
+    return frozenset(sortable), frozenset(filterable), filterable == ["*"]
+
+
+# ....................... #
+
+
+@lru_cache(maxsize=64)
+def _meili_resolve_attributes(
+    model: Type[BaseModel],
+    include: Optional[Tuple[str, ...]],
+    exclude: Optional[FrozenSet[str]],
+) -> Optional[Tuple[str, ...]]:
+    """
+    Resolve the attributes to retrieve from the model fields, cached per arguments
+
+    Args:
+        model (Type[BaseModel]): The model of the indexed documents
+        include (Tuple[str, ...], optional): The fields to include in the search
+        exclude (FrozenSet[str], optional): The fields to exclude from the search
+
+    Returns:
+        attributes (Tuple[str, ...] | None): The attributes to retrieve
+    """
+
+    fields = list(model.model_fields.keys()) + list(model.model_computed_fields.keys())
+
+    if exclude is not None and include is None:
+        return tuple(x for x in fields if x not in exclude)
+
+    elif include is not None:
+        field_set = set(fields)
+        return tuple(x for x in include if x in field_set)
+
+    return None
+
+
+# ....................... #
+
+
+def meili_attributes_to_retrieve(
+    model: Type[BaseModel],
+    include: Optional[List[str]] = None,
+    exclude: Optional[List[str]] = None,
+) -> Optional[List[str]]:
+    """
+    Get the attributes to retrieve from the model fields
+
+    Args:
+        model (Type[BaseModel]): The model of the indexed documents
+        include (List[str], optional): The fields to include in the search
+        exclude (List[str], optional): The fields to exclude from the search
+
+    Returns:
+        attributes (List[str] | None): A new list of the attributes to retrieve
+    """
+
+    attributes = _meili_resolve_attributes(
+        model,
+        tuple(include) if include is not None else None,
+        frozenset(exclude) if exclude is not None else None,
+    )
+
+    return list(attributes) if attributes is not None else None
+
+
+# ....................... #
+
+
+def meili_iter_documents(ix: Index) -> Iterator[JsonDict]:
+    """
+    Iterate over all documents of a Meilisearch index page by page
+
+    Args:
+        ix (meilisearch_python_sdk.Index): Syncronous Meilisearch index
+
+    Yields:
+        document (JsonDict): The next document
+    """
+
+    first = ix.get_documents(offset=0, limit=1000)
+
+    yield from first.results
+
+    offsets = iter(range(1000, first.total, 1000))
+
+    # Prefetch a bounded window of pages, so memory does not grow with the index
+    with ThreadPoolExecutor(max_workers=MEILI_MAX_CONCURRENCY) as executor:
+        pending = deque(
+            executor.submit(ix.get_documents, offset=o, limit=1000)
+            for o in islice(offsets, MEILI_MAX_CONCURRENCY)
+        )
+
+        while pending:
+            page = pending.popleft().result()
+
+            if (o := next(offsets, None)) is not None:
+                pending.append(executor.submit(ix.get_documents, offset=o, limit=1000))
+
+            yield from page.results
+
+
+# ....................... #
+
+
+async def ameili_iter_documents(ix: AsyncIndex) -> AsyncIterator[JsonDict]:
+    """
+    Iterate over all documents of a Meilisearch index page by page in asyncronous mode
+
+    Args:
+        ix (meilisearch_python_sdk.AsyncIndex): Asyncronous Meilisearch index
+
+    Yields:
+        document (JsonDict): The next document
+    """
+
+    first = await ix.get_documents(offset=0, limit=1000)
+
+    for doc in first.results:
+        yield doc
+
+    offsets = iter(range(1000, first.total, 1000))
+
+    # Prefetch a bounded window of pages, so memory does not grow with the index
+    pending = deque(
+        asyncio.ensure_future(ix.get_documents(offset=o, limit=1000))
+        for o in islice(offsets, MEILI_MAX_CONCURRENCY)
+    )
+
+    try:
+        while pending:
+            page = await pending.popleft()
+
+            if (o := next(offsets, None)) is not None:
+                pending.append(
+                    asyncio.ensure_future(ix.get_documents(offset=o, limit=1000))
+                )
+
+            for doc in page.results:
+                yield doc
+
+    finally:
+        for t in pending:
+            t.cancel()
+
+
+# ....................... #
+
+
+def meili_run_in_batches(
+    func: Callable[[list], Any],
+    items: list,
+    batch_size: int,
+) -> None:
+    """
+    Run a syncronous Meilisearch call over batches of items one after another,
+    so tasks are enqueued in the order of the items
+
+    Args:
+        func (Callable[[list], Any]): The call to run for each batch
+        items (list): The items to split into batches
+        batch_size (int): The maximum number of items per batch
+    """
+
+    for i in range(0, len(items), batch_size):
+        func(items[i : i + batch_size])
+
+
+# ....................... #
+
+
+async def ameili_run_in_batches(
+    func: AsyncCallable[list, Any],
+    items: list,
+    batch_size: int,
+) -> None:
+    """
+    Run an asyncronous Meilisearch call over batches of items one after another,
+    so tasks are enqueued in the order of the items
+
+    Args:
+        func (AsyncCallable[list, Any]): The call to run for each batch
+        items (list): The items to split into batches
+        batch_size (int): The maximum number of items per batch
+    """
+
+    for i in range(0, len(items), batch_size):
+        await func(items[i : i + batch_size])
+
+
+# ....................... #
+
+
+def ameili_spawn(coro: Coroutine[Any, Any, Any]) -> asyncio.Task:
+    """
+    Run a Meilisearch coroutine in background, keeping a reference until it finishes
+
+    Args:
+        coro (Coroutine[Any, Any, Any]): The coroutine to run
+
+    Returns:
+        task (asyncio.Task): The background task
+    """
+
+    task = asyncio.create_task(coro)
+    _meili_background_tasks.add(task)
+    task.add_done_callback(_meili_background_tasks.discard)
+
+    return task
+
+
+# ....................... #
+
+
+async def ameili_wait_background() -> None:
+    """
+    Wait for background Meilisearch tasks of the running event loop to finish
+    """
+
+    loop = asyncio.get_running_loop()
+    current = asyncio.current_task()
+
+    while tasks := [
+        t
+        for t in _meili_background_tasks
+        if t.get_loop() is loop and t is not current and not t.done()
+    ]:
+        await asyncio.gather(*tasks, return_exceptions=True)
+
+
+# ....................... #
+
+
+def ameili_queue_documents(
+    cls: Any,
+    docs: List[Any],
+    cfg: MeilisearchConfig,
+) -> None:
+    """
+    Queue documents of the class for a background Meilisearch update on the running event loop.
+    Documents queued within `debounce_sec` are sent together, the queue is flushed
+    early once it holds `batch_size` documents
+
+    Args:
+        cls (Any): Meilisearch extension class owning the index
+        docs (List[Any]): The documents to update
+        cfg (MeilisearchConfig): Meilisearch configuration of the class
+    """
+
+    if cfg.debounce_sec <= 0:
+        ameili_spawn(cls.ameili_update_documents(docs))
+        return
+
+    loop = asyncio.get_running_loop()
+    buffers = _ameili_write_buffers.setdefault(loop, {})
+    pending = buffers.get(cls)
+
+    if pending is None:
+        pending = buffers[cls] = []
+        loop.call_later(cfg.debounce_sec, _ameili_send_queued, cls, pending)
+
+    pending.extend(docs)
+
+    if len(pending) >= cfg.batch_size:
+        _ameili_send_queued(cls, pending)
+
+
+# ....................... #
+
+
+def _ameili_send_queued(cls: Any, pending: List[Any]) -> None:
+    """
+    Send queued documents of the class in background and start a new queue
+
+    Args:
+        cls (Any): Meilisearch extension class owning the index
+        pending (List[Any]): The queued documents
+    """
+
+    buffers = _ameili_write_buffers.get(asyncio.get_running_loop(), {})
+
+    if buffers.get(cls) is pending:
+        del buffers[cls]
+
+    # The queue may have been sent already, early or by a flush
+    if pending:
+        batch = pending.copy()
+        pending.clear()
+        ameili_spawn(cls.ameili_update_documents(batch))
+
+
+# ....................... #
+
+
+async def ameili_flush_queued() -> None:
+    """
+    Send all documents queued on the running event loop without waiting for
+    the debounce delay, and wait for background Meilisearch updates to finish
+    """
+
+    buffers = _ameili_write_buffers.get(asyncio.get_running_loop(), {})
+
+    for c, pending in list(buffers.items()):
+        _ameili_send_queued(c, pending)
+
+    await ameili_wait_background()
@@ -46,6 +46,61 @@ class SortField(BaseModel):
 
 F = TypeVar("F", bound="FilterABC")
 
+# Rendered boolean filter values
+_BOOL_LITERALS = {True: "true", False: "false"}
+
+# ....................... #
+
+
+def _meili_quote(value: Any) -> str:
+    """
+    Render a value as a Meilisearch filter literal
+
+    Args:
+        value (Any): The value to render
+
+    Returns:
+        literal (str): The rendered literal
+    """
+
+    if isinstance(value, bool):
+        return _BOOL_LITERALS[value]
+
+    if isinstance(value, (int, float)):
+        return str(value)
+
+    escaped = str(value).replace("\\", "\\\\").replace('"', '\\"')
+
+    return f'"{escaped}"'
+
+
+# ....................... #
+
+
+def _build_range(key: str, low: Any, high: Any) -> Optional[str]:
+    """
+    Build a range filter expression
+
+    Args:
+        key (str): The filter key
+        low (Any): The lower bound
+        high (Any): The upper bound
+
+    Returns:
+        expression (str | None): The filter expression
+    """
+
+    if low is None:
+        return f"{key} <= {high}" if high is not None else None
+
+    if high is None:
+        return f"{key} >= {low}"
+
+    return f"{key} {low} TO {high}"
+
+
+# ....................... #
+
 
 class FilterABC(ABC, BaseModel):
     """
@@ -89,7 +144,7 @@ class BooleanFilter(FilterABC):
 
     def build(self):
         if self.value is not None:
-            return f"{self.key} = {str(self.value).lower()}"
+            return f"{self.key} = {_BOOL_LITERALS[self.value]}"
 
         return None
 
@@ -115,16 +170,7 @@ class NumberFilter(FilterABC):
     def build(self):
         low, high = self.value
 
-        if low is None and high is not None:
-            return f"{self.key} <= {high}"
-
-        if low is not None and high is None:
-            return f"{self.key} >= {low}"
-
-        if low is not None and high is not None:
-            return f"{self.key} {low} TO {high}"
-
-        return None
+        return _build_range(self.key, low, high)
 
 
 # ....................... #
@@ -148,16 +194,7 @@ class DatetimeFilter(FilterABC):
     def build(self):
         low, high = self.value
 
-        if low is None and high is not None:
-            return f"{self.key} <= {high}"
-
-        if low is not None and high is None:
-            return f"{self.key} >= {low}"
-
-        if low is not None and high is not None:
-            return f"{self.key} {low} TO {high}"
-
-        return None
+        return _build_range(self.key, low, high)
 
 
 # ....................... #
@@ -180,7 +217,7 @@ class ArrayFilter(FilterABC):
 
     def build(self):
         if self.value:
-            return f"{self.key} IN {self.value}"
+            return f"{self.key} IN [{', '.join(map(_meili_quote, self.value))}]"
 
         return None
 
@@ -236,7 +273,8 @@ class SearchResponse(TableResponse):
         assert res.page is not None, "Page must be provided"
         assert res.total_hits is not None, "Total hits must be provided"
 
-        return cls(
+        # Hits are already checked by `TabularData`, skip revalidation of trusted data
+        return cls.model_construct(
             hits=TabularData(res.hits),
             size=res.hits_per_page,
             page=res.page,
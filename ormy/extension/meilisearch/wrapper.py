@@ -1,8 +1,20 @@
 from contextlib import asynccontextmanager, contextmanager
-from typing import Dict, List, Optional, Type, TypeVar
+from functools import cache
+from typing import (
+    AsyncIterator,
+    Callable,
+    ClassVar,
+    Dict,
+    FrozenSet,
+    Iterator,
+    List,
+    Optional,
+    Tuple,
+    Type,
+    TypeVar,
+)
 
 from meilisearch_python_sdk import AsyncClient, AsyncIndex, Client, Index
-from meilisearch_python_sdk.errors import MeilisearchApiError
 from meilisearch_python_sdk.models.search import SearchResults
 from meilisearch_python_sdk.models.settings import MeilisearchSettings
 from meilisearch_python_sdk.types import JsonDict
@@ -11,6 +23,29 @@ from ormy.base.abc import AbstractABC
 from ormy.base.logging import LogManager
 
 from .config import MeilisearchConfig
+from .func import (
+    MEILI_SORT_SUFFIX,
+    MeiliClientKey,
+    ameili_ensure_index,
+    ameili_ensure_indexes,
+    ameili_flush_queued,
+    ameili_iter_documents,
+    ameili_queue_documents,
+    ameili_run_in_batches,
+    ameili_shared_client,
+    meili_attributes_to_retrieve,
+    meili_cached_health,
+    meili_client_key,
+    meili_ensure_index,
+    meili_ensure_indexes,
+    meili_existing_indexes,
+    meili_health_by_url,
+    meili_iter_documents,
+    meili_probe_health,
+    meili_request_attributes,
+    meili_run_in_batches,
+    meili_shared_client,
+)
 from .schema import (  # noqa: F401
     ArrayFilter,
     BooleanFilter,
@@ -21,6 +56,7 @@ from .schema import (  # noqa: F401
     SearchResponse,
     SomeFilter,
     SortField,
+    SortOrder,
 )
 
 # ----------------------- #
@@ -36,6 +72,11 @@ class MeilisearchExtension(AbstractABC):
     configs = [MeilisearchConfig()]
     _registry = {MeilisearchConfig: {}}
 
+    _meili_ready: ClassVar[bool] = False
+
+    # JSON of the index settings known to be applied on the server
+    _meili_applied_settings: ClassVar[Optional[str]] = None
+
     # ....................... #
 
     def __init_subclass__(cls: Type[M], **kwargs):
@@ -43,7 +84,6 @@ class MeilisearchExtension(AbstractABC):
 
         cls._meili_register_subclass()
         cls._merge_registry()
-        cls._meili_safe_create_or_update()
 
         MeilisearchExtension._registry = cls._merge_registry_helper(
             MeilisearchExtension._registry,
@@ -60,13 +100,13 @@ class MeilisearchExtension(AbstractABC):
         ix = cfg.index
 
         if cfg.include_to_registry and not cfg.is_default():
-            logger.debug(f"Registering {cls.__name__} in {ix}")
-            logger.debug(f"Registry before: {cls._registry}")
+            logger.debug("Registering %s in %s", cls.__name__, ix)
+            logger.debug("Registry before: %s", cls._registry)
 
             cls._registry[MeilisearchConfig] = cls._registry.get(MeilisearchConfig, {})
             cls._registry[MeilisearchConfig][ix] = cls
 
-            logger.debug(f"Registry after: {cls._registry}")
+            logger.debug("Registry after: %s", cls._registry)
 
     # ....................... #
 
@@ -158,57 +198,79 @@ class MeilisearchExtension(AbstractABC):
         cfg = cls.get_config(type_=MeilisearchConfig)
 
         if not cfg.is_default():
-            with cls._meili_client() as c:  # type: ignore
-                try:
-                    ix = c.get_index(cfg.index)
-                    logger.debug(f"Index `{cfg.index}` already exists")
-                    settings = MeilisearchSettings.model_validate(
-                        cfg.settings.model_dump()
-                    )
+            c = cls._meili_get_client()
+
+            existing = meili_existing_indexes(c, cls._meili_client_key())
+            settings = MeilisearchSettings.model_validate(cfg.settings.model_dump())
 
-                    if ix.get_settings() != settings:
-                        cls._meili_update_index(settings)
-                        logger.debug(f"Update of index `{cfg.index}` is started")
+            if cfg.index in existing:
+                ix = c.index(cfg.index)
+                logger.debug(f"Index `{cfg.index}` already exists")
 
-                except MeilisearchApiError:
-                    settings = MeilisearchSettings.model_validate(
-                        cfg.settings.model_dump()
-                    )
-                    c.create_index(
-                        cfg.index,
-                        primary_key=cfg.primary_key,
-                        settings=settings,
-                    )
-                    logger.debug(f"Index `{cfg.index}` is created")
+                if ix.get_settings() != settings:
+                    ix.update_settings(settings)
+                    logger.debug(f"Update of index `{cfg.index}` is started")
+
+            else:
+                c.create_index(
+                    cfg.index,
+                    primary_key=cfg.primary_key,
+                    settings=settings,
+                )
+                existing.add(cfg.index)
+                logger.debug(f"Index `{cfg.index}` is created")
+
+            cls._meili_applied_settings = settings.model_dump_json()
 
     # ....................... #
 
     @classmethod
-    @contextmanager
-    def _meili_client(cls: Type[M]):
-        """Get syncronous Meilisearch client"""
+    @cache
+    def _meili_client_key(cls: Type[M]) -> MeiliClientKey:
+        """
+        Get the key identifying Meilisearch clients for the class configuration,
+        resolved once per class
 
-        cfg = cls.get_config(type_=MeilisearchConfig)
-        url = cfg.url()
-        key = cfg.credentials.master_key
+        Returns:
+            key (MeiliClientKey): Meilisearch URL, API key and HTTP/2 flag
+        """
 
-        if key:
-            api_key = key.get_secret_value()
+        return meili_client_key(cls.get_config(type_=MeilisearchConfig))
 
-        else:
-            api_key = None
+    # ....................... #
 
-        c = Client(
-            url=url,
-            api_key=api_key,
-            custom_headers={"Content-Type": "application/json"},
-        )
+    @classmethod
+    def _meili_get_client(cls: Type[M]) -> Client:
+        """
+        Get shared syncronous Meilisearch client
+
+        Returns:
+            client (meilisearch_python_sdk.Client): Syncronous Meilisearch client
+        """
+
+        return meili_shared_client(cls._meili_client_key())
+
+    # ....................... #
+
+    @classmethod
+    def _ameili_get_client(cls: Type[M]) -> AsyncClient:
+        """
+        Get shared asyncronous Meilisearch client for the running event loop
+
+        Returns:
+            client (meilisearch_python_sdk.AsyncClient): Asyncronous Meilisearch client
+        """
+
+        return ameili_shared_client(cls._meili_client_key())
 
-        try:
-            yield c
+    # ....................... #
+
+    @classmethod
+    @contextmanager
+    def _meili_client(cls: Type[M]):
+        """Get syncronous Meilisearch client"""
 
-        finally:
-            pass
+        yield cls._meili_get_client()
 
     # ....................... #
 
@@ -217,43 +279,92 @@ class MeilisearchExtension(AbstractABC):
     async def _ameili_client(cls: Type[M]):
         """Get asyncronous Meilisearch client"""
 
-        cfg = cls.get_config(type_=MeilisearchConfig)
-        url = cfg.url()
-        key = cfg.credentials.master_key
+        yield cls._ameili_get_client()
 
-        if key:
-            api_key = key.get_secret_value()
+    # ....................... #
 
-        else:
-            api_key = None
+    @classmethod
+    def _meili_probe_health(cls: Type[M]) -> bool:
+        """Request Meilisearch health"""
 
-        c = AsyncClient(
-            url=url,
-            api_key=api_key,
-            custom_headers={"Content-Type": "application/json"},
-        )
+        return meili_probe_health(cls._meili_get_client())
+
+    # ....................... #
 
-        try:
-            yield c
+    @classmethod
+    def meili_health(cls: Type[M]) -> bool:
+        """
+        Check Meilisearch health, results are reused for a few seconds per url
+
+        Returns:
+            status (bool): Whether Meilisearch is available
+        """
 
-        finally:
-            pass
+        return meili_cached_health(cls._meili_client_key()[0], cls._meili_probe_health)
 
     # ....................... #
 
     @classmethod
-    def meili_health(cls: Type[M]) -> bool:
-        """Check Meilisearch health"""
+    def meili_health_all(cls: Type[M]) -> Dict[str, bool]:
+        """
+        Check health of every Meilisearch instance used by registered subclasses,
+        probing each url once and concurrently
+
+        Returns:
+            statuses (Dict[str, bool]): Availability for each url
+        """
+
+        checks: Dict[str, Callable[[], bool]] = {}
+
+        for s in cls._registry.get(MeilisearchConfig, {}).values():
+            url = s.get_config(type_=MeilisearchConfig).url()
+            checks.setdefault(url, s.meili_health)
+
+        return meili_health_by_url(checks)
+
+    # ....................... #
+
+    @classmethod
+    def _meili_ensure_index(cls: Type[M]):
+        """
+        Create or update the Meilisearch index on first use of the class
+        """
+
+        meili_ensure_index(cls)
+
+    # ....................... #
+
+    @classmethod
+    async def _ameili_ensure_index(cls: Type[M]):
+        """
+        Create or update the Meilisearch index on first use of the class in asyncronous mode
+        """
+
+        await ameili_ensure_index(cls)
+
+    # ....................... #
+
+    @classmethod
+    def meili_bootstrap_all(cls: Type[M]):
+        """
+        Create or update Meilisearch indexes of all registered subclasses concurrently
+        """
 
-        try:
-            with cls._meili_client() as c:  # type: ignore
-                h = c.health()
-                status = h.status == "available"
+        subclasses = list(cls._registry.get(MeilisearchConfig, {}).values())
 
-        except Exception:
-            status = False
+        meili_ensure_indexes(subclasses)
 
-        return status
+    # ....................... #
+
+    @classmethod
+    async def ameili_bootstrap_all(cls: Type[M]):
+        """
+        Create or update Meilisearch indexes of all registered subclasses concurrently in asyncronous mode
+        """
+
+        subclasses = list(cls._registry.get(MeilisearchConfig, {}).values())
+
+        await ameili_ensure_indexes(subclasses)
 
     # ....................... #
 
@@ -261,10 +372,10 @@ class MeilisearchExtension(AbstractABC):
     def _meili_index(cls: Type[M]) -> Index:
         """Get associated Meilisearch index"""
 
+        cls._meili_ensure_index()
         cfg = cls.get_config(type_=MeilisearchConfig)
 
-        with cls._meili_client() as c:  # type: ignore
-            return c.get_index(cfg.index)
+        return cls._meili_get_client().index(cfg.index)
 
     # ....................... #
 
@@ -272,10 +383,10 @@ class MeilisearchExtension(AbstractABC):
     async def _ameili_index(cls: Type[M]) -> AsyncIndex:
         """Get associated Meilisearch index in asyncronous mode"""
 
+        await cls._ameili_ensure_index()
         cfg = cls.get_config(type_=MeilisearchConfig)
 
-        async with cls._ameili_client() as c:  # type: ignore
-            return await c.get_index(cfg.index)
+        return cls._ameili_get_client().index(cfg.index)
 
     # ....................... #
 
@@ -284,11 +395,37 @@ class MeilisearchExtension(AbstractABC):
         """Update Meilisearch index settings"""
 
         ix = cls._meili_index()
+        applied = settings.model_dump_json()
+
+        # Settings are static per class, skip the round trip once they are known to match
+        if cls.__dict__.get("_meili_applied_settings") == applied:
+            return
+
         available_settings = ix.get_settings()
 
         if settings != available_settings:
             ix.update_settings(settings)
 
+        cls._meili_applied_settings = applied
+
+    # ....................... #
+
+    @classmethod
+    @cache
+    def _meili_request_attributes(
+        cls: Type[M],
+    ) -> Tuple[FrozenSet[str], FrozenSet[str], bool]:
+        """
+        Get sortable and filterable attributes as sets, built once per class
+
+        Returns:
+            sortable (FrozenSet[str]): Sortable attributes
+            filterable (FrozenSet[str]): Filterable attributes
+            filter_all (bool): Whether all attributes are filterable
+        """
+
+        return meili_request_attributes(cls.get_config(type_=MeilisearchConfig))
+
     # ....................... #
 
     @classmethod
@@ -300,26 +437,20 @@ class MeilisearchExtension(AbstractABC):
     ):
         """Prepare search request"""
 
-        cfg = cls.get_config(type_=MeilisearchConfig)
-        sortable = cfg.settings.sortable_attributes
-        filterable = cfg.settings.filterable_attributes
-
-        if sortable is None:
-            sortable = []
+        sortable, filterable, filter_all = cls._meili_request_attributes()
 
         if request.sort and request.sort in sortable:
-            sort = [f"{request.sort}:{request.order.value}"]
+            sort = [request.sort + MEILI_SORT_SUFFIX[request.order]]
 
         else:
             sort = None
 
         if request.filters and filterable:
             filters = [
-                f.build()
+                b
                 for f in request.filters
-                if f.key in filterable or filterable == ["*"]
+                if (filter_all or f.key in filterable) and (b := f.build()) is not None
             ]
-            filters = list(filter(None, filters))
 
         else:
             filters = []
@@ -356,13 +487,7 @@ class MeilisearchExtension(AbstractABC):
         """
         ...
         """
-        fields = list(cls.model_fields.keys()) + list(cls.model_computed_fields.keys())
-
-        if exclude is not None and include is None:
-            include = [x for x in fields if x not in exclude]
-
-        elif include is not None:
-            include = [x for x in include if x in fields]
+        include = meili_attributes_to_retrieve(cls, include, exclude)
 
         ix = cls._meili_index()
         req = cls._meili_prepare_request(request, page, size)
@@ -387,13 +512,7 @@ class MeilisearchExtension(AbstractABC):
         """
         ...
         """
-        fields = list(cls.model_fields.keys()) + list(cls.model_computed_fields.keys())
-
-        if exclude is not None and include is None:
-            include = [x for x in fields if x not in exclude]
-
-        elif include is not None:
-            include = [x for x in include if x in fields]
+        include = meili_attributes_to_retrieve(cls, include, exclude)
 
         ix = await cls._ameili_index()
         req = cls._meili_prepare_request(request, page, size)
@@ -407,82 +526,153 @@ class MeilisearchExtension(AbstractABC):
     # ....................... #
 
     @classmethod
-    def meili_delete_documents(cls: Type[M], ids: str | List[str]):
+    def meili_delete_documents(
+        cls: Type[M],
+        ids: str | List[str],
+        batch_size: Optional[int] = None,
+    ):
         ix = cls._meili_index()
 
         if isinstance(ids, str):
             ids = [ids]
 
-        ix.delete_documents(ids)
+        if batch_size is None:
+            batch_size = cls.get_config(type_=MeilisearchConfig).batch_size
+
+        meili_run_in_batches(ix.delete_documents, ids, batch_size)
 
     # ....................... #
 
     @classmethod
-    async def ameili_delete_documents(cls: Type[M], ids: str | List[str]):
+    async def ameili_delete_documents(
+        cls: Type[M],
+        ids: str | List[str],
+        batch_size: Optional[int] = None,
+    ):
         ix = await cls._ameili_index()
 
         if isinstance(ids, str):
             ids = [ids]
 
-        await ix.delete_documents(ids)
+        if batch_size is None:
+            batch_size = cls.get_config(type_=MeilisearchConfig).batch_size
+
+        await ameili_run_in_batches(ix.delete_documents, ids, batch_size)
 
     # ....................... #
 
     @classmethod
-    def _meili_all_documents(cls: Type[M]):
-        ix = cls._meili_index()
-        res: List[JsonDict] = []
-        offset = 0
+    def _meili_iter_documents(cls: Type[M]) -> Iterator[JsonDict]:
+        """
+        Iterate over all documents from Meilisearch page by page
 
-        while docs := ix.get_documents(offset=offset, limit=1000).results:
-            res.extend(docs)
-            offset += 1000
+        Yields:
+            document (JsonDict): The next document
+        """
 
-        return res
+        yield from meili_iter_documents(cls._meili_index())
 
     # ....................... #
 
     @classmethod
-    async def _ameili_all_documents(cls: Type[M]):
-        ix = await cls._ameili_index()
-        res: List[JsonDict] = []
-        offset = 0
+    async def _ameili_iter_documents(cls: Type[M]) -> AsyncIterator[JsonDict]:
+        """
+        Iterate over all documents from Meilisearch page by page in asyncronous mode
 
-        while docs := (await ix.get_documents(offset=offset, limit=1000)).results:
-            res.extend(docs)
-            offset += 1000
+        Yields:
+            document (JsonDict): The next document
+        """
 
-        return res
+        async for doc in ameili_iter_documents(await cls._ameili_index()):
+            yield doc
 
     # ....................... #
 
     @classmethod
-    def meili_update_documents(cls: Type[M], docs: M | List[M]):
+    def _meili_all_documents(cls: Type[M]):
+        return list(cls._meili_iter_documents())
+
+    # ....................... #
+
+    @classmethod
+    async def _ameili_all_documents(cls: Type[M]):
+        return [doc async for doc in cls._ameili_iter_documents()]
+
+    # ....................... #
+
+    @classmethod
+    def meili_update_documents(
+        cls: Type[M],
+        docs: M | List[M],
+        batch_size: Optional[int] = None,
+    ):
         ix = cls._meili_index()
 
         if not isinstance(docs, list):
             docs = [docs]
 
         doc_dicts = [d.model_dump() for d in docs]
-        ix.update_documents(doc_dicts)
+
+        if batch_size is None:
+            batch_size = cls.get_config(type_=MeilisearchConfig).batch_size
+
+        meili_run_in_batches(ix.update_documents, doc_dicts, batch_size)
 
     # ....................... #
 
     @classmethod
-    async def ameili_update_documents(cls: Type[M], docs: M | List[M]):
+    async def ameili_update_documents(
+        cls: Type[M],
+        docs: M | List[M],
+        batch_size: Optional[int] = None,
+    ):
         ix = await cls._ameili_index()
 
         if not isinstance(docs, list):
             docs = [docs]
 
         doc_dicts = [d.model_dump() for d in docs]
-        await ix.update_documents(doc_dicts)
+
+        if batch_size is None:
+            batch_size = cls.get_config(type_=MeilisearchConfig).batch_size
+
+        await ameili_run_in_batches(ix.update_documents, doc_dicts, batch_size)
+
+    # ....................... #
+
+    @classmethod
+    def ameili_queue_documents(cls: Type[M], docs: M | List[M]):
+        """
+        Queue documents for a background Meilisearch update on the running event loop.
+        Documents queued within `debounce_sec` are sent together, the queue is flushed
+        early once it holds `batch_size` documents. Await `ameili_flush` before the
+        event loop stops, so queued documents are not lost
+
+        Args:
+            docs (M | List[M]): The documents to update
+        """
+
+        if not isinstance(docs, list):
+            docs = [docs]
+
+        ameili_queue_documents(cls, docs, cls.get_config(type_=MeilisearchConfig))
+
+    # ....................... #
+
+    @classmethod
+    async def ameili_flush(cls: Type[M]):
+        """
+        Send all documents queued on the running event loop without waiting for
+        the debounce delay, and wait for background Meilisearch updates to finish
+        """
+
+        await ameili_flush_queued()
 
     # ....................... #
 
     @classmethod
     def meili_last_update(cls: Type[M]) -> Optional[int]:
-        ix = cls._meili_index()
+        ix = cls._meili_index().fetch_info()
         dt = ix.updated_at
 
         if dt:
@@ -494,7 +684,7 @@ class MeilisearchExtension(AbstractABC):
 
     @classmethod
     async def ameili_last_update(cls: Type[M]) -> Optional[int]:
-        ix = await cls._ameili_index()
+        ix = await (await cls._ameili_index()).fetch_info()
         dt = ix.updated_at
 
         if dt:
@@ -1,25 +1,55 @@
 from contextlib import asynccontextmanager, contextmanager
+from functools import cache
 from typing import (
     Any,
+    AsyncIterator,
     Callable,
     ClassVar,
     Dict,
+    FrozenSet,
+    Iterator,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
 )
 
 from meilisearch_python_sdk import AsyncClient, AsyncIndex, Client, Index
-from meilisearch_python_sdk.errors import MeilisearchApiError
 from meilisearch_python_sdk.models.search import SearchResults
 from meilisearch_python_sdk.models.settings import MeilisearchSettings
 from meilisearch_python_sdk.types import JsonDict
 
 from ormy.base.abc import ExtensionABC
+from ormy.base.abc.registry import Registry
 from ormy.base.typing import AsyncCallable
 
 from .config import MeilisearchConfig
+from .func import (
+    MEILI_SORT_SUFFIX,
+    MeiliClientKey,
+    ameili_ensure_index,
+    ameili_ensure_indexes,
+    ameili_flush_queued,
+    ameili_iter_documents,
+    ameili_new_client,
+    ameili_queue_documents,
+    ameili_run_in_batches,
+    ameili_shared_client,
+    meili_attributes_to_retrieve,
+    meili_cached_health,
+    meili_client_key,
+    meili_ensure_index,
+    meili_ensure_indexes,
+    meili_existing_indexes,
+    meili_health_by_url,
+    meili_iter_documents,
+    meili_new_client,
+    meili_probe_health,
+    meili_request_attributes,
+    meili_run_in_batches,
+    meili_shared_client,
+)
 from .schema import (
     ArrayFilter,
     BooleanFilter,
@@ -45,8 +75,10 @@ class MeilisearchExtensionV2(ExtensionABC):
     extension_configs: ClassVar[List[Any]] = [MeilisearchConfig()]
     # _registry = {MeilisearchConfig: {}}
 
-    _meili_static: ClassVar[Optional[Client]] = None
-    _ameili_static: ClassVar[Optional[AsyncClient]] = None
+    _meili_ready: ClassVar[bool] = False
+
+    # JSON of the index settings known to be applied on the server
+    _meili_applied_settings: ClassVar[Optional[str]] = None
 
     # ....................... #
 
@@ -60,7 +92,6 @@ class MeilisearchExtensionV2(ExtensionABC):
             discriminator="index",
         )
         # cls._merge_registry()
-        cls._meili_safe_create_or_update()
 
         # MeilisearchExtensionV2._registry = cls._merge_registry_helper(
         #     MeilisearchExtensionV2._registry,
@@ -172,82 +203,89 @@ class MeilisearchExtensionV2(ExtensionABC):
     # ....................... #
 
     @classmethod
-    def _meili_static_client(cls):
+    @cache
+    def _meili_credentials(cls: Type[M]) -> MeiliClientKey:
         """
-        Get static Meilisearch client
+        Get Meilisearch connection credentials, resolved once per class
 
         Returns:
-            client (meilisearch_python_sdk.Client): Static Meilisearch client
+            url (str): Meilisearch URL
+            api_key (str | None): Meilisearch API key
+            http2 (bool): Whether to use HTTP/2 connections
         """
 
-        health = False
-
-        if cls._meili_static is not None:
-            try:
-                check = cls._meili_static.health()
-                health = check.status == "available"
-
-            except Exception:
-                pass
+        return meili_client_key(cls.get_extension_config(type_=MeilisearchConfig))
 
-        if not health or cls._meili_static is None:
-            cfg = cls.get_extension_config(type_=MeilisearchConfig)
-            url = cfg.url()
-            key = cfg.credentials.master_key
-
-            if key:
-                api_key = key.get_secret_value()
+    # ....................... #
 
-            else:
-                api_key = None
+    @classmethod
+    def _meili_new_client(cls: Type[M]) -> Client:
+        """
+        Create a new syncronous Meilisearch client
 
-            cls._meili_static = Client(
-                url=url,
-                api_key=api_key,
-                custom_headers={"Content-Type": "application/json"},
-            )
+        Returns:
+            client (meilisearch_python_sdk.Client): Syncronous Meilisearch client
+        """
 
-        return cls._meili_static
+        return meili_new_client(cls._meili_credentials())
 
     # ....................... #
 
     @classmethod
-    async def _ameili_static_client(cls):
+    def _ameili_new_client(cls: Type[M]) -> AsyncClient:
         """
-        Get static async Meilisearch client
+        Create a new asyncronous Meilisearch client
 
         Returns:
-            client (meilisearch_python_sdk.AsyncClient): Static async Meilisearch client
+            client (meilisearch_python_sdk.AsyncClient): Asyncronous Meilisearch client
         """
 
-        health = False
+        return ameili_new_client(cls._meili_credentials())
 
-        if cls._ameili_static is not None:
-            try:
-                check = await cls._ameili_static.health()
-                health = check.status == "available"
+    # ....................... #
 
-            except Exception:
-                pass
+    @classmethod
+    @contextmanager
+    def _meili_client(cls: Type[M]):
+        """Get syncronous Meilisearch client"""
 
-        if not health or cls._ameili_static is None:
-            cfg = cls.get_extension_config(type_=MeilisearchConfig)
-            url = cfg.url()
-            key = cfg.credentials.master_key
+        yield cls._meili_new_client()
 
-            if key:
-                api_key = key.get_secret_value()
+    # ....................... #
 
-            else:
-                api_key = None
+    @classmethod
+    @asynccontextmanager
+    async def _ameili_client(cls: Type[M]):
+        """Get asyncronous Meilisearch client"""
+
+        yield cls._ameili_new_client()
 
-            cls._ameili_static = AsyncClient(
-                url=url,
-                api_key=api_key,
-                custom_headers={"Content-Type": "application/json"},
-            )
+    # ....................... #
+
+    @classmethod
+    def _meili_static_client(cls):
+        """
+        Get static Meilisearch client shared by classes with the same credentials
+
+        Returns:
+            client (meilisearch_python_sdk.Client): Static Meilisearch client
+        """
+
+        return meili_shared_client(cls._meili_credentials())
+
+    # ....................... #
+
+    @classmethod
+    async def _ameili_static_client(cls):
+        """
+        Get static async Meilisearch client shared by classes with the same credentials
+        for the running event loop
+
+        Returns:
+            client (meilisearch_python_sdk.AsyncClient): Static async Meilisearch client
+        """
 
-        return cls._ameili_static
+        return ameili_shared_client(cls._meili_credentials())
 
     # ....................... #
 
@@ -263,8 +301,7 @@ class MeilisearchExtensionV2(ExtensionABC):
             return task(c)
 
         else:
-            with cls._meili_client() as c:
-                return task(c)
+            return task(cls._meili_new_client())
 
     # ....................... #
 
@@ -280,8 +317,7 @@ class MeilisearchExtensionV2(ExtensionABC):
             return await task(c)
 
         else:
-            async with cls._ameili_client() as c:
-                return await task(c)
+            return await task(cls._ameili_new_client())
 
     # ....................... #
 
@@ -296,102 +332,115 @@ class MeilisearchExtensionV2(ExtensionABC):
         cfg = cls.get_extension_config(type_=MeilisearchConfig)
 
         def _task(c: Client):
-            try:
-                ix = c.get_index(cfg.index)
+            existing = meili_existing_indexes(c, cls._meili_credentials())
+            settings = MeilisearchSettings.model_validate(cfg.settings.model_dump())
+
+            if cfg.index in existing:
+                ix = c.index(cfg.index)
                 cls._logger.debug(f"Index `{cfg.index}` already exists")
-                settings = MeilisearchSettings.model_validate(cfg.settings.model_dump())
 
                 if ix.get_settings() != settings:
-                    cls._meili_update_index(settings)
+                    ix.update_settings(settings)
                     cls._logger.debug(f"Update of index `{cfg.index}` is started")
 
-            except MeilisearchApiError:
-                settings = MeilisearchSettings.model_validate(cfg.settings.model_dump())
+            else:
                 c.create_index(
                     cfg.index,
                     primary_key=cfg.primary_key,
                     settings=settings,
                 )
+                existing.add(cfg.index)
                 cls._logger.debug(f"Index `{cfg.index}` is created")
 
+            cls._meili_applied_settings = settings.model_dump_json()
+
         if not cfg.is_default():
             cls.__meili_execute_task(_task)
 
     # ....................... #
 
-    @classmethod  # TODO: move above
-    @contextmanager
-    def _meili_client(cls):
-        """Get syncronous Meilisearch client"""
-
-        cfg = cls.get_extension_config(type_=MeilisearchConfig)
-        url = cfg.url()
-        key = cfg.credentials.master_key
+    @classmethod
+    def _meili_probe_health(cls: Type[M]) -> bool:
+        """Request Meilisearch health"""
 
-        if key:
-            api_key = key.get_secret_value()
+        return cls.__meili_execute_task(meili_probe_health)
 
-        else:
-            api_key = None
+    # ....................... #
 
-        c = Client(
-            url=url,
-            api_key=api_key,
-            custom_headers={"Content-Type": "application/json"},
-        )
+    @classmethod
+    def meili_health(cls: Type[M]) -> bool:
+        """
+        Check Meilisearch health, results are reused for a few seconds per url
 
-        try:
-            yield c
+        Returns:
+            status (bool): Whether Meilisearch is available
+        """
 
-        finally:
-            pass
+        return meili_cached_health(cls._meili_credentials()[0], cls._meili_probe_health)
 
     # ....................... #
 
-    @classmethod  # TODO: move above
-    @asynccontextmanager
-    async def _ameili_client(cls):
-        """Get asyncronous Meilisearch client"""
+    @classmethod
+    def meili_health_all(cls: Type[M]) -> Dict[str, bool]:
+        """
+        Check health of every Meilisearch instance used by registered subclasses,
+        probing each url once and concurrently
 
-        cfg = cls.get_extension_config(type_=MeilisearchConfig)
-        url = cfg.url()
-        key = cfg.credentials.master_key
+        Returns:
+            statuses (Dict[str, bool]): Availability for each url
+        """
 
-        if key:
-            api_key = key.get_secret_value()
+        checks: Dict[str, Callable[[], bool]] = {}
 
-        else:
-            api_key = None
+        for s in Registry.get().get(MeilisearchConfig.__name__, {}).values():
+            url = s.get_extension_config(type_=MeilisearchConfig).url()
+            checks.setdefault(url, s.meili_health)
 
-        c = AsyncClient(
-            url=url,
-            api_key=api_key,
-            custom_headers={"Content-Type": "application/json"},
-        )
+        return meili_health_by_url(checks)
 
-        try:
-            yield c
+    # ....................... #
 
-        finally:
-            pass
+    @classmethod
+    def _meili_ensure_index(cls: Type[M]):
+        """
+        Create or update the Meilisearch index on first use of the class
+        """
+
+        meili_ensure_index(cls)
 
     # ....................... #
 
     @classmethod
-    def meili_health(cls: Type[M]) -> bool:
-        """Check Meilisearch health"""
+    async def _ameili_ensure_index(cls: Type[M]):
+        """
+        Create or update the Meilisearch index on first use of the class in asyncronous mode
+        """
 
-        def _task(c: Client):
-            try:
-                h = c.health()
-                status = h.status == "available"
+        await ameili_ensure_index(cls)
+
+    # ....................... #
 
-            except Exception:
-                status = False
+    @classmethod
+    def meili_bootstrap_all(cls: Type[M]):
+        """
+        Create or update Meilisearch indexes of all registered subclasses concurrently
+        """
 
-            return status
+        subclasses = list(Registry.get().get(MeilisearchConfig.__name__, {}).values())
 
-        return cls.__meili_execute_task(_task)
+        meili_ensure_indexes(subclasses)
+
+    # ....................... #
+
+    @classmethod
+    async def ameili_bootstrap_all(cls: Type[M]):
+        """
+        Create or update Meilisearch indexes of all registered subclasses concurrently in asyncronous mode
+        """
+
+        subclasses = list(Registry.get().get(MeilisearchConfig.__name__, {}).values())
+
+        await ameili_ensure_indexes(subclasses)
 
     # ....................... #
 
@@ -399,10 +448,11 @@ class MeilisearchExtensionV2(ExtensionABC):
     def _meili_index(cls: Type[M]) -> Index:
         """Get associated Meilisearch index"""
 
+        cls._meili_ensure_index()
         cfg = cls.get_extension_config(type_=MeilisearchConfig)
 
         def _task(c: Client):
-            return c.get_index(cfg.index)
+            return c.index(cfg.index)
 
         return cls.__meili_execute_task(_task)
 
@@ -412,10 +462,11 @@ class MeilisearchExtensionV2(ExtensionABC):
     async def _ameili_index(cls: Type[M]) -> AsyncIndex:
         """Get associated Meilisearch index in asyncronous mode"""
 
+        await cls._ameili_ensure_index()
         cfg = cls.get_extension_config(type_=MeilisearchConfig)
 
         async def _task(c: AsyncClient):
-            return await c.get_index(cfg.index)
+            return c.index(cfg.index)
 
         return await cls.__ameili_execute_task(_task)
 
@@ -431,11 +482,39 @@ class MeilisearchExtensionV2(ExtensionABC):
         """
 
         ix = cls._meili_index()
+        applied = settings.model_dump_json()
+
+        # Settings are static per class, skip the round trip once they are known to match
+        if cls.__dict__.get("_meili_applied_settings") == applied:
+            return
+
         available_settings = ix.get_settings()
 
         if settings != available_settings:
             ix.update_settings(settings)
 
+        cls._meili_applied_settings = applied
+
+    # ....................... #
+
+    @classmethod
+    @cache
+    def _meili_request_attributes(
+        cls: Type[M],
+    ) -> Tuple[FrozenSet[str], FrozenSet[str], bool]:
+        """
+        Get sortable and filterable attributes as sets, built once per class
+
+        Returns:
+            sortable (FrozenSet[str]): Sortable attributes
+            filterable (FrozenSet[str]): Filterable attributes
+            filter_all (bool): Whether all attributes are filterable
+        """
+
+        return meili_request_attributes(
+            cls.get_extension_config(type_=MeilisearchConfig)
+        )
+
     # ....................... #
 
     @classmethod
@@ -457,26 +536,20 @@ class MeilisearchExtensionV2(ExtensionABC):
             request (dict): The prepared search request
         """
 
-        cfg = cls.get_extension_config(type_=MeilisearchConfig)
-        sortable = cfg.settings.sortable_attributes
-        filterable = cfg.settings.filterable_attributes
-
-        if sortable is None:
-            sortable = []
+        sortable, filterable, filter_all = cls._meili_request_attributes()
 
         if request.sort and request.sort in sortable:
-            sort = [f"{request.sort}:{request.order.value}"]
+            sort = [request.sort + MEILI_SORT_SUFFIX[request.order]]
 
         else:
             sort = None
 
         if request.filters and filterable:
             filters = [
-                f.build()
+                b
                 for f in request.filters
-                if f.key in filterable or filterable == ["*"]
+                if (filter_all or f.key in filterable) and (b := f.build()) is not None
             ]
-            filters = list(filter(None, filters))
 
         else:
             filters = []
@@ -530,13 +603,7 @@ class MeilisearchExtensionV2(ExtensionABC):
             response (SearchResponse): The search response
         """
 
-        fields = list(cls.model_fields.keys()) + list(cls.model_computed_fields.keys())
-
-        if exclude is not None and include is None:
-            include = [x for x in fields if x not in exclude]
-
-        elif include is not None:
-            include = [x for x in include if x in fields]
+        include = meili_attributes_to_retrieve(cls, include, exclude)
 
         ix = cls._meili_index()
         req = cls._meili_prepare_request(request, page, size)
@@ -572,13 +639,7 @@ class MeilisearchExtensionV2(ExtensionABC):
             response (SearchResponse): The search response
         """
 
-        fields = list(cls.model_fields.keys()) + list(cls.model_computed_fields.keys())
-
-        if exclude is not None and include is None:
-            include = [x for x in fields if x not in exclude]
-
-        elif include is not None:
-            include = [x for x in include if x in fields]
+        include = meili_attributes_to_retrieve(cls, include, exclude)
 
         ix = await cls._ameili_index()
         req = cls._meili_prepare_request(request, page, size)
@@ -592,12 +653,17 @@ class MeilisearchExtensionV2(ExtensionABC):
     # ....................... #
 
     @classmethod
-    def meili_delete_documents(cls: Type[M], ids: str | List[str]):
+    def meili_delete_documents(
+        cls: Type[M],
+        ids: str | List[str],
+        batch_size: Optional[int] = None,
+    ):
         """
         Delete documents from Meilisearch
 
         Args:
             ids (str | List[str]): The document IDs
+            batch_size (int, optional): The maximum number of IDs per request. Defaults to the config batch size.
         """
 
         ix = cls._meili_index()
@@ -605,17 +671,25 @@ class MeilisearchExtensionV2(ExtensionABC):
         if isinstance(ids, str):
             ids = [ids]
 
-        ix.delete_documents(ids)
+        if batch_size is None:
+            batch_size = cls.get_extension_config(type_=MeilisearchConfig).batch_size
+
+        meili_run_in_batches(ix.delete_documents, ids, batch_size)
 
     # ....................... #
 
     @classmethod
-    async def ameili_delete_documents(cls: Type[M], ids: str | List[str]):
+    async def ameili_delete_documents(
+        cls: Type[M],
+        ids: str | List[str],
+        batch_size: Optional[int] = None,
+    ):
         """
         Delete documents from Meilisearch in asyncronous mode
 
         Args:
             ids (str | List[str]): The document IDs
+            batch_size (int, optional): The maximum number of IDs per request. Defaults to the config batch size.
         """
 
         ix = await cls._ameili_index()
@@ -623,7 +697,37 @@ class MeilisearchExtensionV2(ExtensionABC):
         if isinstance(ids, str):
             ids = [ids]
 
-        await ix.delete_documents(ids)
+        if batch_size is None:
+            batch_size = cls.get_extension_config(type_=MeilisearchConfig).batch_size
+
+        await ameili_run_in_batches(ix.delete_documents, ids, batch_size)
+
+    # ....................... #
+
+    @classmethod
+    def _meili_iter_documents(cls: Type[M]) -> Iterator[JsonDict]:
+        """
+        Iterate over all documents from Meilisearch page by page
+
+        Yields:
+            document (JsonDict): The next document
+        """
+
+        yield from meili_iter_documents(cls._meili_index())
+
+    # ....................... #
+
+    @classmethod
+    async def _ameili_iter_documents(cls: Type[M]) -> AsyncIterator[JsonDict]:
+        """
+        Iterate over all documents from Meilisearch page by page in asyncronous mode
+
+        Yields:
+            document (JsonDict): The next document
+        """
+
+        async for doc in ameili_iter_documents(await cls._ameili_index()):
+            yield doc
 
     # ....................... #
 
@@ -636,15 +740,7 @@ class MeilisearchExtensionV2(ExtensionABC):
             documents (List[JsonDict]): The list of documents
         """
 
-        ix = cls._meili_index()
-        res: List[JsonDict] = []
-        offset = 0
-
-        while docs := ix.get_documents(offset=offset, limit=1000).results:
-            res.extend(docs)
-            offset += 1000
-
-        return res
+        return list(cls._meili_iter_documents())
 
     # ....................... #
 
@@ -657,25 +753,22 @@ class MeilisearchExtensionV2(ExtensionABC):
             documents (List[JsonDict]): The list of documents
         """
 
-        ix = await cls._ameili_index()
-        res: List[JsonDict] = []
-        offset = 0
-
-        while docs := (await ix.get_documents(offset=offset, limit=1000)).results:
-            res.extend(docs)
-            offset += 1000
-
-        return res
+        return [doc async for doc in cls._ameili_iter_documents()]
 
     # ....................... #
 
     @classmethod
-    def meili_update_documents(cls: Type[M], docs: M | List[M]):
+    def meili_update_documents(
+        cls: Type[M],
+        docs: M | List[M],
+        batch_size: Optional[int] = None,
+    ):
         """
         Update documents in Meilisearch
 
         Args:
             docs (M | List[M]): The documents to update
+            batch_size (int, optional): The maximum number of documents per request. Defaults to the config batch size.
         """
 
         ix = cls._meili_index()
@@ -707,17 +800,26 @@ class MeilisearchExtensionV2(ExtensionABC):
                             pass
 
         doc_dicts = [d.model_dump() for d in docs if d not in masked]
-        ix.update_documents(doc_dicts)
+
+        if batch_size is None:
+            batch_size = cls.get_extension_config(type_=MeilisearchConfig).batch_size
+
+        meili_run_in_batches(ix.update_documents, doc_dicts, batch_size)
 
     # ....................... #
 
     @classmethod
-    async def ameili_update_documents(cls: Type[M], docs: M | List[M]):
+    async def ameili_update_documents(
+        cls: Type[M],
+        docs: M | List[M],
+        batch_size: Optional[int] = None,
+    ):
         """
         Update documents in Meilisearch in asyncronous mode
 
         Args:
             docs (M | List[M]): The documents to update
+            batch_size (int, optional): The maximum number of documents per request. Defaults to the config batch size.
         """
 
         ix = await cls._ameili_index()
@@ -749,7 +851,43 @@ class MeilisearchExtensionV2(ExtensionABC):
                             pass
 
         doc_dicts = [d.model_dump() for d in docs if d not in masked]
-        await ix.update_documents(doc_dicts)
+
+        if batch_size is None:
+            batch_size = cls.get_extension_config(type_=MeilisearchConfig).batch_size
+
+        await ameili_run_in_batches(ix.update_documents, doc_dicts, batch_size)
+
+    # ....................... #
+
+    @classmethod
+    def ameili_queue_documents(cls: Type[M], docs: M | List[M]):
+        """
+        Queue documents for a background Meilisearch update on the running event loop.
+        Documents queued within `debounce_sec` are sent together, the queue is flushed
+        early once it holds `batch_size` documents. Await `ameili_flush` before the
+        event loop stops, so queued documents are not lost
+
+        Args:
+            docs (M | List[M]): The documents to update
+        """
+
+        if not isinstance(docs, list):
+            docs = [docs]
+
+        ameili_queue_documents(
+            cls, docs, cls.get_extension_config(type_=MeilisearchConfig)
+        )
+
+    # ....................... #
+
+    @classmethod
+    async def ameili_flush(cls: Type[M]):
+        """
+        Send all documents queued on the running event loop without waiting for
+        the debounce delay, and wait for background Meilisearch updates to finish
+        """
+
+        await ameili_flush_queued()
 
     # ....................... #
 
@@ -762,7 +900,7 @@ class MeilisearchExtensionV2(ExtensionABC):
             timestamp (int | None): The last update timestamp
         """
 
-        ix = cls._meili_index()
+        ix = cls._meili_index().fetch_info()
         dt = ix.updated_at
 
         if dt:
@@ -781,7 +919,7 @@ class MeilisearchExtensionV2(ExtensionABC):
             timestamp (int | None): The last update timestamp
         """
 
-        ix = await cls._ameili_index()
+        ix = await (await cls._ameili_index()).fetch_info()
         dt = ix.updated_at
 
         if dt:
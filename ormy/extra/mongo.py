@@ -1,4 +1,3 @@
-import asyncio
 from concurrent.futures import ThreadPoolExecutor
 from contextlib import asynccontextmanager, contextmanager
 from typing import Any, ClassVar, Dict, List, Optional, Self, Type, TypeVar
@@ -44,7 +43,7 @@ class MongoWithMeilisearchBackground(MongoBase, MeilisearchExtension):
         await super().asave()
 
         # Run in background
-        asyncio.create_task(self.ameili_update_documents(self))
+        self.ameili_queue_documents(self)
 
         return self
 
@@ -67,7 +66,7 @@ class MongoWithMeilisearchBackground(MongoBase, MeilisearchExtension):
         res = await super().acreate(data)  # type: ignore
 
         # Run in background
-        asyncio.create_task(cls.ameili_update_documents(res))
+        cls.ameili_queue_documents(res)
 
         return res
 
@@ -96,7 +95,7 @@ class MongoWithMeilisearchBackground(MongoBase, MeilisearchExtension):
         await super().acreate_many(data, ordered=ordered)  # type: ignore
 
         # Run in background
-        asyncio.create_task(cls.ameili_update_documents(data))
+        cls.ameili_queue_documents(data)
 
 
 # ----------------------- #
@@ -207,7 +206,7 @@ class MongoWithMeilisearchBackgroundV2(MongoSingleBase, MeilisearchExtensionV2):
         res = await super().asave()
 
         # Run in background
-        asyncio.create_task(self.ameili_update_documents(res))
+        self.ameili_queue_documents(res)
 
         return res
 
@@ -230,7 +229,7 @@ class MongoWithMeilisearchBackgroundV2(MongoSingleBase, MeilisearchExtensionV2):
         res = await super().acreate(data)  # type: ignore
 
         # Run in background
-        asyncio.create_task(cls.ameili_update_documents(res))
+        cls.ameili_queue_documents(res)
 
         return res
 
@@ -259,7 +258,7 @@ class MongoWithMeilisearchBackgroundV2(MongoSingleBase, MeilisearchExtensionV2):
         await super().acreate_many(data, ordered=ordered)  # type: ignore
 
         # Run in background
-        asyncio.create_task(cls.ameili_update_documents(data))
+        cls.ameili_queue_documents(data)
 
 
 # ----------------------- #
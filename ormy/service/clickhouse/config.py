@@ -1,6 +1,6 @@
 from typing import Optional
 
-from pydantic import SecretStr
+from pydantic import PositiveInt, SecretStr
 
 from ormy.base.abc import ConfigABC
 from ormy.base.pydantic import Base
@@ -47,6 +47,7 @@ class ClickHouseConfig(ConfigABC):
     Attributes:
         database (str): ClickHouse database
         table (str): ClickHouse table
+        pool_maxsize (int): Maximum number of pooled HTTP connections
         log_level (ormy.utils.logging.LogLevel): Log level
         include_to_registry (bool): Whether to include to registry
         credentials (ClickHouseCredentials): ClickHouse connection credentials
@@ -54,6 +55,7 @@ class ClickHouseConfig(ConfigABC):
 
     database: str = "default"
     table: str = "default"
+    pool_maxsize: PositiveInt = 32
 
     credentials: ClickHouseCredentials = ClickHouseCredentials()
 
@@ -1,8 +1,11 @@
+import asyncio
 import logging
 from math import ceil
 from typing import Any
+from weakref import WeakKeyDictionary
 
 import httpx
+from requests.adapters import HTTPAdapter
 from infi.clickhouse_orm import database, models, utils  # type: ignore[import-untyped]
 
 # ----------------------- #
@@ -14,12 +17,46 @@ logger = logging.getLogger("clickhouse_orm")  # TODO: refactor
 
 
 class AsyncDatabase(database.Database):
-    def __init__(self, *args, **kwargs):
+    def __init__(self, *args, pool_maxsize: int = 32, **kwargs):
         super().__init__(*args, **kwargs)
 
         self.__username = kwargs.get("username", "default")
         self.__password = kwargs.get("password", None)
 
+        # Size connection pools for concurrent queries instead of library defaults
+        adapter = HTTPAdapter(pool_connections=pool_maxsize, pool_maxsize=pool_maxsize)
+        self.request_session.mount("http://", adapter)
+        self.request_session.mount("https://", adapter)
+
+        self.__limits = httpx.Limits(
+            max_connections=pool_maxsize,
+            max_keepalive_connections=pool_maxsize,
+        )
+        self.__aclients: WeakKeyDictionary[
+            asyncio.AbstractEventLoop, httpx.AsyncClient
+        ] = WeakKeyDictionary()
+
+    # ....................... #
+
+    def _aclient(self) -> httpx.AsyncClient:
+        """
+        Get pooled asyncronous HTTP client for the running event loop
+
+        Returns:
+            client (httpx.AsyncClient): Asyncronous HTTP client
+        """
+
+        loop = asyncio.get_running_loop()
+        client = self.__aclients.get(loop)
+
+        if client is None:
+            # Mirror the sync session, which only authenticates when a username is set
+            auth = (self.__username, self.__password or "") if self.__username else None
+            client = httpx.AsyncClient(auth=auth, limits=self.__limits)
+            self.__aclients[loop] = client
+
+        return client
+
     # ....................... #
 
     async def _asend(self, data, settings: Any = None, stream: bool = False):
@@ -30,30 +67,25 @@ class AsyncDatabase(database.Database):
                 logger.info(data)
 
         params = self._build_params(settings)
+        session = self._aclient()
 
         if stream:
-            async with httpx.AsyncClient(
-                auth=(self.__username, self.__password)
-            ) as session:
-                async with session.stream(
-                    method="POST",
-                    url=self.db_url,
-                    params=params,
-                    content=data,
-                    timeout=self.timeout,
-                ) as r:
-                    return r
+            async with session.stream(
+                method="POST",
+                url=self.db_url,
+                params=params,
+                content=data,
+                timeout=self.timeout,
+            ) as r:
+                return r
 
         else:
-            async with httpx.AsyncClient(
-                auth=(self.__username, self.__password)
-            ) as session:
-                r = await session.post(
-                    url=self.db_url,
-                    params=params,
-                    content=data,
-                    timeout=self.timeout,
-                )
+            r = await session.post(
+                url=self.db_url,
+                params=params,
+                content=data,
+                timeout=self.timeout,
+            )
 
         if r.status_code != 200:
             raise database.ServerError(r.text)
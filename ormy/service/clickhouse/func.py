@@ -11,6 +11,7 @@ def get_clickhouse_db(
     username: Optional[str] = None,
     password: Optional[str] = None,
     verify_ssl_cert: bool = False,
+    pool_maxsize: int = 32,
     **kwargs,
 ):
     """
@@ -22,6 +23,7 @@ def get_clickhouse_db(
         username (str, optional): ClickHouse username
         password (str, optional): ClickHouse password
         verify_ssl_cert (bool): Whether to verify SSL certificate
+        pool_maxsize (int): Maximum number of pooled HTTP connections
         **kwargs: Additional keyword arguments
 
     Returns:
@@ -34,5 +36,6 @@ def get_clickhouse_db(
         username=username,
         password=password,
         db_url=db_url,
+        pool_maxsize=pool_maxsize,
         **kwargs,
     )
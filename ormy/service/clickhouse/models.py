@@ -1,4 +1,4 @@
-from typing import Any, List
+from typing import Any, Dict, Iterable, List
 
 from infi.clickhouse_orm import (  # type: ignore[import-untyped]
     database,
@@ -42,6 +42,38 @@ def ClickHouseField(
 # ....................... #
 
 
+def _rows_to_tabular(rows: Iterable[models.Model], field_names: Iterable[str]):
+    """
+    Convert ORM rows to tabular data, resolving selected columns once per row class
+
+    Args:
+        rows (Iterable[infi.clickhouse_orm.models.Model]): The rows to convert
+        field_names (Iterable[str]): The field names to include
+
+    Returns:
+        data (TabularData): The tabular data
+    """
+
+    wanted = set(field_names)
+    columns: Dict[type, List[str]] = {}
+    items = []
+
+    for r in rows:
+        names = columns.get(type(r))
+
+        # Keep the model field order, same as `Model.to_dict`
+        if names is None:
+            names = columns[type(r)] = [f for f in r.fields() if f in wanted]
+
+        data = r.__dict__
+        items.append({n: data[n] for n in names})
+
+    return TabularData(items)
+
+
+# ....................... #
+
+
 class ClickHousePage:
     def __init__(
         self,
@@ -84,9 +116,7 @@ class ClickHousePage:
     # ....................... #
 
     def tabular(self) -> TabularData:
-        qs = [r.to_dict(field_names=self.fields) for r in self.objects]
-
-        return TabularData(qs)
+        return _rows_to_tabular(self.objects, self.fields)
 
 
 # ....................... #
@@ -94,9 +124,7 @@ class ClickHousePage:
 
 class ClickHouseQuerySet(query.QuerySet):
     def tabular(self) -> TabularData:
-        qs = [r.to_dict(field_names=self._fields) for r in self]
-
-        return TabularData(qs)
+        return _rows_to_tabular(self, self._fields)
 
     # ....................... #
 
@@ -121,9 +149,8 @@ class ClickHouseQuerySet(query.QuerySet):
 class ClickHouseAggregateQuerySet(query.AggregateQuerySet):
     def tabular(self) -> TabularData:
         all_fields = list(self._fields) + list(self._calculated_fields.keys())
-        qs = [r.to_dict(field_names=all_fields) for r in self]
 
-        return TabularData(qs)
+        return _rows_to_tabular(self, all_fields)
 
     # ....................... #
 
@@ -1,10 +1,12 @@
 import inspect
+from functools import cache
 from typing import (
-    Any,
     ClassVar,
     Dict,
+    FrozenSet,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
 )
@@ -15,6 +17,7 @@ from ormy.base.abc import AbstractABC
 from ormy.base.logging import LogManager
 
 from .config import ClickHouseConfig
+from .database import AsyncDatabase
 from .func import get_clickhouse_db
 from .models import ClickHouseFieldInfo, ClickHouseModel, ClickHouseQuerySet
 
@@ -34,6 +37,12 @@ class ClickHouseBase(AbstractABC):
     _registry = {ClickHouseConfig: {}}
     _model: ClassVar[Optional[ClickHouseModel]] = None  # type: ignore[assignment]
 
+    # Databases shared by classes with the same connection, keyed by
+    # (database, url, username, password, pool size)
+    _adatabases: ClassVar[
+        Dict[Tuple[str, str, Optional[str], Optional[str], int], AsyncDatabase]
+    ] = {}
+
     # ....................... #
 
     def __init_subclass__(cls: type[Ch], **kwargs):
@@ -41,12 +50,6 @@ class ClickHouseBase(AbstractABC):
 
         cls.__clickhouse_register_subclass()
         cls.__construct_model()
-        cls._merge_registry()
-
-        ClickHouseBase._registry = cls._merge_registry_helper(
-            ClickHouseBase._registry,
-            cls._registry,
-        )
 
         cls._model.set_database(cls, cls._get_adatabase())  # type: ignore
 
@@ -54,34 +57,25 @@ class ClickHouseBase(AbstractABC):
 
     @classmethod
     def __construct_model(cls: Type[Ch]):
-        _dict_: Dict[str, Any] = {}
-        orm_fields = {}
+        orm_fields: Dict[str, fields.Field] = {}
         engine = None
 
         parents = inspect.getmro(cls)
 
+        # Single pass from the most generic parent, so subclasses override fields
         for p in parents[::-1]:
             if issubclass(p, ClickHouseBase):
                 for attr_name, attr_value in p.__dict__.items():
-                    if isinstance(attr_value, ClickHouseFieldInfo) or isinstance(
-                        attr_value, engines.Engine
-                    ):
-                        _dict_[attr_name] = attr_value
+                    if isinstance(attr_value, ClickHouseFieldInfo):
+                        orm_fields[attr_name] = attr_value.clickhouse
 
-                    elif attr_name in ["model_fields", "__pydantic_fields__"]:
+                    elif isinstance(attr_value, engines.Engine):
+                        engine = attr_value
+
+                    elif attr_name in ("model_fields", "__pydantic_fields__"):
                         for k, v in attr_value.items():
                             if isinstance(v, ClickHouseFieldInfo):
-                                _dict_[k] = v.clickhouse
-
-        for attr_name, attr_value in _dict_.items():
-            if isinstance(attr_value, ClickHouseFieldInfo):
-                orm_fields[attr_name] = attr_value.clickhouse
-
-            elif isinstance(attr_value, fields.Field):
-                orm_fields[attr_name] = attr_value
-
-            elif isinstance(attr_value, engines.Engine):
-                engine = attr_value
+                                orm_fields[k] = v.clickhouse
 
         # Dynamically create the ORM model
         orm_attrs = {"engine": engine, **orm_fields}
@@ -104,23 +98,18 @@ class ClickHouseBase(AbstractABC):
         table = cfg.table
 
         if cfg.include_to_registry and not cfg.is_default():
-            logger.debug(f"Registering {cls.__name__} in {db}.{table}")
-            logger.debug(f"Registry before: {cls._registry}")
-
-            cls._registry[ClickHouseConfig] = cls._registry.get(ClickHouseConfig, {})
-            cls._registry[ClickHouseConfig][db] = cls._registry[ClickHouseConfig].get(
-                db, {}
-            )
-            cls._registry[ClickHouseConfig][db][table] = cls
+            logger.debug("Registering %s in %s.%s", cls.__name__, db, table)
 
-            logger.debug(f"Registry after: {cls._registry}")
+            # Only the new leaf changes, so insert it in place instead of merging registries
+            registry = ClickHouseBase._registry.setdefault(ClickHouseConfig, {})
+            registry.setdefault(db, {})[table] = cls
 
     # ....................... #
 
     @classmethod
-    def _get_adatabase(cls: Type[Ch]):
+    def _get_adatabase(cls: Type[Ch]) -> AsyncDatabase:
         """
-        Get ClickHouse database connection
+        Get ClickHouse database connection shared by classes with the same credentials
         """
 
         cfg = cls.get_config(type_=ClickHouseConfig)
@@ -136,12 +125,27 @@ class ClickHouseBase(AbstractABC):
             else None
         )
 
-        return get_clickhouse_db(
-            db_name=cfg.database,
-            username=username,
-            password=password,
-            db_url=cfg.url(),
+        key = (
+            cfg.database,
+            cfg.url(),
+            username,
+            password,
+            cfg.pool_maxsize,
         )
+        db = cls._adatabases.get(key)
+
+        # Database construction queries the server, so build it once per connection
+        if db is None:
+            db = get_clickhouse_db(
+                db_name=cfg.database,
+                username=username,
+                password=password,
+                db_url=cfg.url(),
+                pool_maxsize=cfg.pool_maxsize,
+            )
+            cls._adatabases[key] = db
+
+        return db
 
     # ....................... #
 
@@ -152,14 +156,22 @@ class ClickHouseBase(AbstractABC):
     # ....................... #
 
     @classmethod
-    def _get_materialized_fields(cls: Type[Ch]):
-        fields = []
+    @cache
+    def _get_materialized_fields(cls: Type[Ch]) -> FrozenSet[str]:
+        return frozenset(
+            x
+            for x, v in cls.model_fields.items()
+            if v.clickhouse.materialized  # type: ignore[attr-defined]
+        )
+
+    # ....................... #
 
-        for x, v in cls.model_fields.items():
-            if v.clickhouse.materialized:  # type: ignore[attr-defined]
-                fields.append(x)
+    @classmethod
+    def _build_model_records(cls: Type[Ch], records: List[Ch]) -> List[ClickHouseModel]:
+        exclude = cls._get_materialized_fields()
+        model = cls._model
 
-        return fields
+        return [model(**record.model_dump(exclude=exclude)) for record in records]  # type: ignore
 
     # ....................... #
 
@@ -172,14 +184,8 @@ class ClickHouseBase(AbstractABC):
         if not isinstance(records, list):
             records = [records]
 
-        model_records = [
-            cls._model(
-                **record.model_dump(
-                    exclude=cls._get_materialized_fields(),  # type: ignore
-                )
-            )  # type: ignore
-            for record in records
-        ]
+        model_records = cls._build_model_records(records)
+
         return cls._get_adatabase().insert(model_records, batch_size=batch_size)
 
     # ....................... #
@@ -193,14 +199,8 @@ class ClickHouseBase(AbstractABC):
         if not isinstance(records, list):
             records = [records]
 
-        model_records = [
-            cls._model(
-                **record.model_dump(
-                    exclude=cls._get_materialized_fields(),  # type: ignore
-                )
-            )  # type: ignore
-            for record in records
-        ]
+        model_records = cls._build_model_records(records)
+
         return await cls._get_adatabase().ainsert(model_records, batch_size=batch_size)
 
     # ....................... #
@@ -1,10 +1,12 @@
 import inspect
+from functools import cache
 from typing import (
-    Any,
     ClassVar,
     Dict,
+    FrozenSet,
     List,
     Optional,
+    Tuple,
     Type,
     TypeVar,
 )
@@ -17,6 +19,7 @@ from infi.clickhouse_orm import (  # type: ignore[import-untyped]
 from ormy.base.abc import AbstractSingleABC
 
 from .config import ClickHouseConfig
+from .database import AsyncDatabase
 from .func import get_clickhouse_db
 from .models import ClickHouseFieldInfo, ClickHouseModel, ClickHouseQuerySet
 
@@ -36,6 +39,12 @@ class ClickHouseSingleBase(AbstractSingleABC):
     # _registry = {ClickHouseConfig: {}}
     _model: ClassVar[Optional[ClickHouseModel]] = None  # type: ignore[assignment]
 
+    # Databases shared by classes with the same connection, keyed by
+    # (database, url, username, password, pool size)
+    _adatabases: ClassVar[
+        Dict[Tuple[str, str, Optional[str], Optional[str], int], AsyncDatabase]
+    ] = {}
+
     # ....................... #
 
     def __init_subclass__(cls: type[Ch], **kwargs):
@@ -60,34 +69,25 @@ class ClickHouseSingleBase(AbstractSingleABC):
     def __construct_model(cls: Type[Ch]):
         """Construct ClickHouse model"""
 
-        _dict_: Dict[str, Any] = {}
-        orm_fields = {}
+        orm_fields: Dict[str, fields.Field] = {}
         engine = None
 
         parents = inspect.getmro(cls)
 
+        # Single pass from the most generic parent, so subclasses override fields
         for p in parents[::-1]:
             if issubclass(p, ClickHouseSingleBase):
                 for attr_name, attr_value in p.__dict__.items():
-                    if isinstance(attr_value, ClickHouseFieldInfo) or isinstance(
-                        attr_value, engines.Engine
-                    ):
-                        _dict_[attr_name] = attr_value
+                    if isinstance(attr_value, ClickHouseFieldInfo):
+                        orm_fields[attr_name] = attr_value.clickhouse
+
+                    elif isinstance(attr_value, engines.Engine):
+                        engine = attr_value
 
-                    elif attr_name in ["model_fields", "__pydantic_fields__"]:
+                    elif attr_name in ("model_fields", "__pydantic_fields__"):
                         for k, v in attr_value.items():
                             if isinstance(v, ClickHouseFieldInfo):
-                                _dict_[k] = v.clickhouse
-
-        for attr_name, attr_value in _dict_.items():
-            if isinstance(attr_value, ClickHouseFieldInfo):
-                orm_fields[attr_name] = attr_value.clickhouse
-
-            elif isinstance(attr_value, fields.Field):
-                orm_fields[attr_name] = attr_value
-
-            elif isinstance(attr_value, engines.Engine):
-                engine = attr_value
+                                orm_fields[k] = v.clickhouse
 
         # Dynamically create the ORM model
         orm_attrs = {"engine": engine, **orm_fields}
@@ -111,9 +111,9 @@ class ClickHouseSingleBase(AbstractSingleABC):
     # ....................... #
 
     @classmethod
-    def _get_adatabase(cls: Type[Ch]):
+    def _get_adatabase(cls: Type[Ch]) -> AsyncDatabase:
         """
-        Get ClickHouse database connection
+        Get ClickHouse database connection shared by classes with the same credentials
         """
 
         username = (
@@ -127,12 +127,27 @@ class ClickHouseSingleBase(AbstractSingleABC):
             else None
         )
 
-        return get_clickhouse_db(
-            db_name=cls.config.database,
-            username=username,
-            password=password,
-            db_url=cls.config.url(),
+        key = (
+            cls.config.database,
+            cls.config.url(),
+            username,
+            password,
+            cls.config.pool_maxsize,
         )
+        db = cls._adatabases.get(key)
+
+        # Database construction queries the server, so build it once per connection
+        if db is None:
+            db = get_clickhouse_db(
+                db_name=cls.config.database,
+                username=username,
+                password=password,
+                db_url=cls.config.url(),
+                pool_maxsize=cls.config.pool_maxsize,
+            )
+            cls._adatabases[key] = db
+
+        return db
 
     # ....................... #
 
@@ -145,16 +160,34 @@ class ClickHouseSingleBase(AbstractSingleABC):
     # ....................... #
 
     @classmethod
-    def _get_materialized_fields(cls: Type[Ch]):
-        """Get materialized fields"""
+    @cache
+    def _get_materialized_fields(cls: Type[Ch]) -> FrozenSet[str]:
+        """Get materialized fields, computed once per class"""
+
+        return frozenset(
+            x
+            for x, v in cls.model_fields.items()
+            if v.clickhouse.materialized  # type: ignore[attr-defined]
+        )
+
+    # ....................... #
+
+    @classmethod
+    def _build_model_records(cls: Type[Ch], records: List[Ch]) -> List[ClickHouseModel]:
+        """
+        Convert records to ClickHouse ORM model instances
+
+        Args:
+            records (List[ClickHouseSingleBase]): Records to convert
 
-        fields = []
+        Returns:
+            model_records (List[ClickHouseModel]): ClickHouse ORM model instances
+        """
 
-        for x, v in cls.model_fields.items():
-            if v.clickhouse.materialized:  # type: ignore[attr-defined]
-                fields.append(x)
+        exclude = cls._get_materialized_fields()
+        model = cls._model
 
-        return fields
+        return [model(**record.model_dump(exclude=exclude)) for record in records]  # type: ignore
 
     # ....................... #
 
@@ -175,14 +208,7 @@ class ClickHouseSingleBase(AbstractSingleABC):
         if not isinstance(records, list):
             records = [records]
 
-        model_records = [
-            cls._model(
-                **record.model_dump(
-                    exclude=cls._get_materialized_fields(),  # type: ignore
-                )
-            )  # type: ignore
-            for record in records
-        ]
+        model_records = cls._build_model_records(records)
 
         return cls._get_adatabase().insert(
             model_instances=model_records,
@@ -208,14 +234,7 @@ class ClickHouseSingleBase(AbstractSingleABC):
         if not isinstance(records, list):
             records = [records]
 
-        model_records = [
-            cls._model(
-                **record.model_dump(
-                    exclude=cls._get_materialized_fields(),  # type: ignore
-                )
-            )  # type: ignore
-            for record in records
-        ]
+        model_records = cls._build_model_records(records)
 
         return await cls._get_adatabase().ainsert(
             model_instances=model_records,
@@ -1,7 +1,10 @@
+import asyncio
 from contextlib import asynccontextmanager, contextmanager
+from functools import cache
 from typing import (
     Any,
     Callable,
+    ClassVar,
     Dict,
     List,
     Optional,
@@ -11,15 +14,18 @@ from typing import (
     Union,
     cast,
 )
+from weakref import WeakKeyDictionary
 
-from firebase_admin import firestore, firestore_async  # type: ignore
+import firebase_admin  # type: ignore
 from google.api_core.retry import AsyncRetry, Retry
 from google.cloud.firestore_v1 import (
+    AsyncClient,
     AsyncCollectionReference,
     AsyncDocumentReference,
     AsyncQuery,
     AsyncTransaction,
     AsyncWriteBatch,
+    Client,
     CollectionReference,
     DocumentReference,
     FieldFilter,
@@ -51,6 +57,25 @@ C = TypeVar("C", bound="ConfigABC")
 # ! ???
 FsTransform = Union[Sentinel, ArrayRemove, ArrayUnion, Increment, Maximum, Minimum]
 
+FirestoreClientKey = Tuple[Optional[str], Optional[str], str]
+
+# ----------------------- #
+
+
+def _document_id(id_: Optional[DocumentID]) -> Optional[str]:
+    """
+    Convert a document ID to a Firestore document path, `None` lets Firestore generate one
+
+    Args:
+        id_ (DocumentID, optional): The document ID
+
+    Returns:
+        path (str | None): The document path
+    """
+
+    return str(id_) if id_ is not None else None
+
+
 # ----------------------- #
 
 
@@ -59,6 +84,14 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
     configs = [FirestoreConfig()]
     _registry = {FirestoreConfig: {}}
 
+    # Shared clients keyed by (app name, project ID, database), async ones are bound to their event loop
+    _firestore_clients: ClassVar[Dict[FirestoreClientKey, Client]] = {}
+    _afirestore_clients: ClassVar[
+        WeakKeyDictionary[
+            asyncio.AbstractEventLoop, Dict[FirestoreClientKey, AsyncClient]
+        ]
+    ] = WeakKeyDictionary()
+
     # ....................... #
 
     def __init_subclass__(cls: Type[T], **kwargs):
@@ -93,46 +126,117 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
     # ....................... #
 
     @classmethod
-    @contextmanager
-    def _client(cls: Type[T]):
-        """Get syncronous Firestore client"""
+    @cache
+    def _client_key(cls: Type[T]) -> FirestoreClientKey:
+        """
+        Get the key identifying Firestore clients for the class configuration,
+        resolved once per class
 
-        cfg = cls.get_config(type_=FirestoreConfig)
+        Returns:
+            key (FirestoreClientKey): Firebase app name, project ID and database name
+        """
 
-        project_id = cfg.credentials.project_id
+        cfg = cls.get_config(type_=FirestoreConfig)
         app = cfg.credentials.app
-        database = cfg.database
+        app_name = app.name if app is not None else None
+
+        return app_name, cfg.credentials.project_id, cfg.database
+
+    # ....................... #
 
-        client = firestore.client(app)
-        client._database_string_internal = f"projects/{project_id}/databases/{database}"
+    @classmethod
+    @cache
+    def _collection_name(cls: Type[T]) -> str:
+        """
+        Get the assigned Firestore collection name, resolved once per class
 
-        try:
-            yield client
+        Returns:
+            collection (str): Collection name
+        """
 
-        finally:
-            client.close()
+        return cls.get_config(type_=FirestoreConfig).collection
 
     # ....................... #
 
     @classmethod
-    @asynccontextmanager
-    async def _aclient(cls: Type[T]):
-        """Get asyncronous Firestore client"""
+    def _client_kwargs(cls: Type[T]) -> Dict[str, Any]:
+        """
+        Get keyword arguments to construct a Firestore client bound to the configured project and database
+
+        Returns:
+            kwargs (Dict[str, Any]): Client keyword arguments
+        """
 
         cfg = cls.get_config(type_=FirestoreConfig)
+        app = cfg.credentials.app or firebase_admin.get_app()
 
-        project_id = cfg.credentials.project_id
-        app = cfg.credentials.app
-        database = cfg.database
+        return {
+            "project": cfg.credentials.project_id or app.project_id,
+            "credentials": app.credential.get_credential(),
+            "database": cfg.database,
+        }
 
-        client = firestore_async.client(app)
-        client._database_string_internal = f"projects/{project_id}/databases/{database}"
+    # ....................... #
 
-        try:
-            yield client
+    @classmethod
+    def _get_client(cls: Type[T]) -> Client:
+        """
+        Get shared syncronous Firestore client
+
+        Returns:
+            client (google.cloud.firestore_v1.Client): Syncronous Firestore client
+        """
+
+        key = cls._client_key()
+        client = cls._firestore_clients.get(key)
+
+        if client is None:
+            client = cls._firestore_clients.setdefault(
+                key,
+                Client(**cls._client_kwargs()),
+            )
+
+        return client
+
+    # ....................... #
+
+    @classmethod
+    def _aget_client(cls: Type[T]) -> AsyncClient:
+        """
+        Get shared asyncronous Firestore client for the running event loop
+
+        Returns:
+            client (google.cloud.firestore_v1.AsyncClient): Asyncronous Firestore client
+        """
+
+        key = cls._client_key()
+        loop = asyncio.get_running_loop()
+        clients = cls._afirestore_clients.setdefault(loop, {})
+        client = clients.get(key)
+
+        # No await between lookup and insert, so coroutines cannot race here
+        if client is None:
+            client = clients[key] = AsyncClient(**cls._client_kwargs())
+
+        return client
+
+    # ....................... #
+
+    @classmethod
+    @contextmanager
+    def _client(cls: Type[T]):
+        """Get syncronous Firestore client"""
+
+        yield cls._get_client()
+
+    # ....................... #
+
+    @classmethod
+    @asynccontextmanager
+    async def _aclient(cls: Type[T]):
+        """Get asyncronous Firestore client"""
 
-        finally:
-            client.close()
+        yield cls._aget_client()
 
     # ....................... #
 
@@ -142,8 +246,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        with cls._client() as client:
-            return client.batch()
+        return cls._get_client().batch()
 
     # ....................... #
 
@@ -153,8 +256,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        async with cls._aclient() as client:
-            return client.batch()
+        return cls._aget_client().batch()
 
     # ....................... #
 
@@ -162,10 +264,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
     def _get_collection(cls: Type[T]) -> CollectionReference:
         """Get assigned Firestore collection in syncronous mode"""
 
-        cfg = cls.get_config(type_=FirestoreConfig)
-
-        with cls._client() as client:
-            return client.collection(cfg.collection)
+        return cls._get_client().collection(cls._collection_name())
 
     # ....................... #
 
@@ -173,10 +272,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
     async def _aget_collection(cls: Type[T]) -> AsyncCollectionReference:
         """Get assigned Firestore collection in asyncronous mode"""
 
-        cfg = cls.get_config(type_=FirestoreConfig)
-
-        async with cls._aclient() as client:
-            return client.collection(cfg.collection)
+        return cls._aget_client().collection(cls._collection_name())
 
     # ....................... #
 
@@ -187,8 +283,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         """
 
         collection = cls._get_collection()
-        _id = str(id_) if id_ is not None else None
-        ref = collection.document(_id)
+        ref = collection.document(_document_id(id_))
 
         return ref
 
@@ -201,8 +296,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         """
 
         collection = await cls._aget_collection()
-        _id = str(id_) if id_ is not None else None
-        ref = collection.document(_id)  # type: ignore
+        ref = collection.document(_document_id(id_))  # type: ignore
 
         return ref
 
@@ -214,7 +308,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        document = data.model_dump()
+        document = data._to_storage()
         _id: DocumentID = document["id"]
         ref = cls._ref(_id)
         snapshot = ref.get()
@@ -234,7 +328,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        document = data.model_dump()
+        document = data._to_storage()
         _id: DocumentID = document["id"]
         ref = await cls._aref(_id)
         snapshot = await ref.get()
@@ -309,7 +403,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        document = self.model_dump()
+        document = self._to_storage()
         _id: DocumentID = document["id"]
         ref = self._ref(_id)
         ref.set(document)
@@ -323,7 +417,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        document = self.model_dump()
+        document = self._to_storage()
         _id: DocumentID = document["id"]
         ref = await self._aref(_id)
         await ref.set(document)
@@ -397,22 +491,27 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        batch = cls._batch()
+        documents = [x._to_storage() for x in data]
 
-        for x in data:
-            document = x.model_dump()
-            _id: DocumentID = document["id"]
-            ref = cls._ref(_id)
-            snapshot = ref.get()
+        with cls._client() as client:
+            batch = client.batch()
+            collection = client.collection(cls._collection_name())
+            refs = [collection.document(_document_id(d["id"])) for d in documents]
+
+            # Check existence of all documents in a single request
+            existing = {s.id for s in client.get_all(refs) if s.exists}
 
-            if snapshot.exists:
-                if not bypass:
-                    raise ValueError(f"Document with ID {_id} already exists")
-            else:
-                batch.set(ref, document)
+            for document, ref in zip(documents, refs):
+                if ref.id in existing:
+                    if not bypass:
+                        raise ValueError(
+                            f"Document with ID {document['id']} already exists"
+                        )
+                else:
+                    batch.set(ref, document)
 
-        if autosave:
-            batch.commit()
+            if autosave:
+                batch.commit()
 
         return batch
 
@@ -431,23 +530,28 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        batch = await cls._abatch()
+        documents = [x._to_storage() for x in data]
 
-        for x in data:
-            document = x.model_dump()
-            _id: DocumentID = document["id"]
-            ref = await cls._aref(_id)
-            snapshot = await ref.get()
+        async with cls._aclient() as client:
+            batch = client.batch()
+            collection = client.collection(cls._collection_name())
+            refs = [collection.document(_document_id(d["id"])) for d in documents]
 
-            if snapshot.exists:
-                if not bypass:
-                    raise ValueError(f"Document with ID {_id} already exists")
+            # Check existence of all documents in a single request
+            existing = {s.id async for s in client.get_all(refs) if s.exists}
 
-            else:
-                batch.set(ref, document)
+            for document, ref in zip(documents, refs):
+                if ref.id in existing:
+                    if not bypass:
+                        raise ValueError(
+                            f"Document with ID {document['id']} already exists"
+                        )
 
-        if autosave:
-            await batch.commit()
+                else:
+                    batch.set(ref, document)
+
+            if autosave:
+                await batch.commit()
 
         return batch
 
@@ -553,6 +657,51 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
 
     # ....................... #
 
+    @classmethod
+    def _query(cls: Type[T], filters: Optional[List[FieldFilter]] = None) -> Query:
+        """
+        Build a query over assigned collection in syncronous mode
+
+        Args:
+            filters (List[FieldFilter], optional): The filters to apply
+
+        Returns:
+            query (google.cloud.firestore_v1.Query): The filtered query
+        """
+
+        query = cast(Query, cls._get_collection())
+
+        for f in filters or ():
+            query = query.where(filter=f)
+
+        return query
+
+    # ....................... #
+
+    @classmethod
+    async def _aquery(
+        cls: Type[T],
+        filters: Optional[List[FieldFilter]] = None,
+    ) -> AsyncQuery:
+        """
+        Build a query over assigned collection in asyncronous mode
+
+        Args:
+            filters (List[FieldFilter], optional): The filters to apply
+
+        Returns:
+            query (google.cloud.firestore_v1.AsyncQuery): The filtered query
+        """
+
+        query = cast(AsyncQuery, await cls._aget_collection())
+
+        for f in filters or ():
+            query = query.where(filter=f)
+
+        return query
+
+    # ....................... #
+
     #! TODO: Support transactions
     @classmethod
     def find_many(
@@ -565,14 +714,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        collection = cls._get_collection()
-        query = cast(Query, collection)
-
-        if filters:
-            for f in filters:
-                query = query.where(filter=f)
-
-        query = query.limit(limit).offset(offset)
+        query = cls._query(filters).limit(limit).offset(offset)
         docs = query.get()
 
         return [cls(**doc.to_dict()) for doc in docs]  # type: ignore
@@ -591,14 +733,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        collection = await cls._aget_collection()
-        query = cast(AsyncQuery, collection)
-
-        if filters:
-            for f in filters:
-                query = query.where(filter=f)
-
-        query = query.limit(limit).offset(offset)
+        query = (await cls._aquery(filters)).limit(limit).offset(offset)
         docs = await query.get()
 
         return [cls(**doc.to_dict()) for doc in docs]  # type: ignore
@@ -614,12 +749,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        collection = cls._get_collection()
-        query = cast(Query, collection)
-
-        if filters:
-            for f in filters:
-                query = query.where(filter=f)
+        query = cls._query(filters)
 
         aq: AggregationQuery = query.count()  # type: ignore
         res = aq.get()
@@ -638,12 +768,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        collection = await cls._aget_collection()
-        query = cast(AsyncQuery, collection)
-
-        if filters:
-            for f in filters:
-                query = query.where(filter=f)
+        query = await cls._aquery(filters)
 
         aq: AsyncAggregationQuery = query.count()  # type: ignore
         res = await aq.get()
@@ -663,12 +788,19 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        cnt = cls.count(filters=filters)
+        query = cls._query(filters)
+
         found: List[T] = []
+        page = query.limit(batch_size)
 
-        for j in range(0, cnt, batch_size):
-            docs = cls.find_many(filters=filters, limit=batch_size, offset=j)
-            found.extend(docs)
+        # Continue from the last document instead of an offset, skipped documents are billed
+        while docs := page.get():
+            found.extend(cls(**doc.to_dict()) for doc in docs)  # type: ignore
+
+            if len(docs) < batch_size:
+                break
+
+            page = query.start_after(docs[-1]).limit(batch_size)
 
         return found
 
@@ -684,12 +816,19 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        cnt = await cls.acount(filters=filters)
+        query = await cls._aquery(filters)
+
         found: List[T] = []
+        page = query.limit(batch_size)
+
+        # Continue from the last document instead of an offset, skipped documents are billed
+        while docs := await page.get():
+            found.extend(cls(**doc.to_dict()) for doc in docs)  # type: ignore
 
-        for j in range(0, cnt, batch_size):
-            docs = await cls.afind_many(filters=filters, limit=batch_size, offset=j)
-            found.extend(docs)
+            if len(docs) < batch_size:
+                break
+
+            page = query.start_after(docs[-1]).limit(batch_size)
 
         return found
 
@@ -706,14 +845,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        collection = cls._get_collection()
-        query = cast(Query, collection)
-
-        if filters:
-            for f in filters:
-                query = query.where(filter=f)
-
-        return query.stream()
+        return cls._query(filters).stream()
 
     # ....................... #
 
@@ -728,12 +860,7 @@ class FirestoreBase(DocumentABC):  # TODO: add docstrings
         ...
         """
 
-        collection = await cls._aget_collection()
-        query = cast(AsyncQuery, collection)
-
-        if filters:
-            for f in filters:
-                query = query.where(filter=f)
+        query = await cls._aquery(filters)
 
         return query.stream()
 
@@ -5,7 +5,7 @@ from motor.motor_asyncio import (
     AsyncIOMotorCollection,
     AsyncIOMotorDatabase,
 )
-from pymongo import InsertOne, MongoClient
+from pymongo import InsertOne, MongoClient, ReturnDocument
 from pymongo.collection import Collection
 from pymongo.database import Database
 from pymongo.errors import BulkWriteError
@@ -31,6 +31,7 @@ class MongoBase(DocumentABC):  # TODO: add docstrings
 
     configs = [MongoConfig()]
     _registry = {MongoConfig: {}}
+    _supports_partial_update = True
 
     # ....................... #
 
@@ -41,6 +42,13 @@ class MongoBase(DocumentABC):  # TODO: add docstrings
         cls._merge_registry()
         cls._enable_streaming()
 
+        # Partial updates bypass instance `update` / `save`, disable them if overridden
+        if any(
+            getattr(cls, x) is not getattr(MongoBase, x)
+            for x in ["update", "aupdate", "save", "asave"]
+        ):
+            cls._supports_partial_update = False
+
         MongoBase._registry = cls._merge_registry_helper(
             MongoBase._registry,
             cls._registry,
@@ -57,14 +65,14 @@ class MongoBase(DocumentABC):  # TODO: add docstrings
         col = cfg.collection
 
         if cfg.include_to_registry and not cfg.is_default():
-            logger.debug(f"Registering {cls.__name__} in {db}.{col}")
-            logger.debug(f"Registry before: {cls._registry}")
+            logger.debug("Registering %s in %s.%s", cls.__name__, db, col)
+            logger.debug("Registry before: %s", cls._registry)
 
             cls._registry[MongoConfig] = cls._registry.get(MongoConfig, {})
             cls._registry[MongoConfig][db] = cls._registry[MongoConfig].get(db, {})
             cls._registry[MongoConfig][db][col] = cls
 
-            logger.debug(f"Registry after: {cls._registry}")
+            logger.debug("Registry after: %s", cls._registry)
 
     # ....................... #
 
@@ -264,6 +272,54 @@ class MongoBase(DocumentABC):  # TODO: add docstrings
 
     # ....................... #
 
+    @classmethod
+    def _partial_update(
+        cls: Type[M],
+        id_: DocumentID,
+        updates: Dict[str, Any],
+    ) -> Optional[M]:
+        """
+        Apply field updates to the document with a single `$set` write
+        """
+
+        collection = cls._get_collection()
+        document = collection.find_one_and_update(
+            {"_id": id_},
+            {"$set": updates},
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if not document:
+            raise ValueError(f"Document with ID {id_} not found")
+
+        return cls(**document)
+
+    # ....................... #
+
+    @classmethod
+    async def _apartial_update(
+        cls: Type[M],
+        id_: DocumentID,
+        updates: Dict[str, Any],
+    ) -> Optional[M]:
+        """
+        Apply field updates to the document with a single `$set` write in asyncronous mode
+        """
+
+        collection = cls._aget_collection()
+        document = await collection.find_one_and_update(
+            {"_id": id_},
+            {"$set": updates},
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if not document:
+            raise ValueError(f"Document with ID {id_} not found")
+
+        return cls(**document)
+
+    # ....................... #
+
     @classmethod
     def create_many(
         cls: Type[M],
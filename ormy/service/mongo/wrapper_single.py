@@ -1,11 +1,17 @@
-from typing import ClassVar, List, Optional, Sequence, Type, TypeVar
+from typing import Any, ClassVar, Dict, List, Optional, Sequence, Type, TypeVar
 
 from motor.motor_asyncio import (
     AsyncIOMotorClient,
     AsyncIOMotorCollection,
     AsyncIOMotorDatabase,
 )
-from pymongo import InsertOne, MongoClient, UpdateMany, UpdateOne  # noqa: F401
+from pymongo import (  # noqa: F401
+    InsertOne,
+    MongoClient,
+    ReturnDocument,
+    UpdateMany,
+    UpdateOne,
+)
 from pymongo.collection import Collection
 from pymongo.database import Database
 from pymongo.errors import BulkWriteError, ConnectionFailure, OperationFailure
@@ -32,6 +38,8 @@ class MongoSingleBase(DocumentSingleABC):  # TODO: add docstrings
     _static: ClassVar[Optional[MongoClient]] = None
     _astatic: ClassVar[Optional[AsyncIOMotorClient]] = None
 
+    _supports_partial_update: ClassVar[bool] = True
+
     # ....................... #
 
     def __init_subclass__(cls: Type[M], **kwargs):
@@ -40,6 +48,13 @@ class MongoSingleBase(DocumentSingleABC):  # TODO: add docstrings
         super().__init_subclass__(**kwargs)
 
         cls._register_subclass_helper(discriminator=["database", "collection"])
+
+        # Partial updates bypass instance `update` / `save`, disable them if overridden
+        if any(
+            getattr(cls, x) is not getattr(MongoSingleBase, x)
+            for x in ["update", "aupdate", "save", "asave"]
+        ):
+            cls._supports_partial_update = False
         # cls._merge_registry()
 
         # MongoSingleBase._registry = cls._merge_registry_helper(
@@ -285,6 +300,74 @@ class MongoSingleBase(DocumentSingleABC):  # TODO: add docstrings
 
     # ....................... #
 
+    @classmethod
+    def _partial_update(
+        cls: Type[M],
+        id_: DocumentID,
+        updates: Dict[str, Any],
+    ) -> M:
+        """
+        Apply field updates to the document with a single `$set` write
+
+        Args:
+            id_ (DocumentID): Document ID
+            updates (Dict[str, Any]): Dumped field updates
+
+        Returns:
+            res (MongoBase): Updated data model
+
+        Raises:
+            NotFound: Document not found
+        """
+
+        collection = cls._get_collection()
+        document = collection.find_one_and_update(
+            {"_id": id_},
+            {"$set": updates},
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if not document:
+            raise NotFound(f"Document with ID {id_} not found")
+
+        return cls(**document)
+
+    # ....................... #
+
+    @classmethod
+    async def _apartial_update(
+        cls: Type[M],
+        id_: DocumentID,
+        updates: Dict[str, Any],
+    ) -> M:
+        """
+        Apply field updates to the document with a single `$set` write in asyncronous mode
+
+        Args:
+            id_ (DocumentID): Document ID
+            updates (Dict[str, Any]): Dumped field updates
+
+        Returns:
+            res (MongoBase): Updated data model
+
+        Raises:
+            NotFound: Document not found
+        """
+
+        collection = await cls._aget_collection()
+        document = await collection.find_one_and_update(
+            {"_id": id_},
+            {"$set": updates},
+            return_document=ReturnDocument.AFTER,
+        )
+
+        if not document:
+            raise NotFound(f"Document with ID {id_} not found")
+
+        return cls(**document)
+
+    # ....................... #
+
     @classmethod
     def create_many(
         cls: Type[M],
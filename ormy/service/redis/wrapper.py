@@ -53,14 +53,14 @@ class RedisBase(DocumentABC):  # TODO: add docstrings
 
         # TODO: use exact default value from class
         if cfg.include_to_registry and not cfg.is_default():
-            logger.debug(f"Registering {cls.__name__} in {db}.{col}")
-            logger.debug(f"Registry before: {cls._registry}")
+            logger.debug("Registering %s in %s.%s", cls.__name__, db, col)
+            logger.debug("Registry before: %s", cls._registry)
 
             cls._registry[RedisConfig] = cls._registry.get(RedisConfig, {})
             cls._registry[RedisConfig][db] = cls._registry[RedisConfig].get(db, {})
             cls._registry[RedisConfig][db][col] = cls
 
-            logger.debug(f"Registry after: {cls._registry}")
+            logger.debug("Registry after: %s", cls._registry)
 
     # ....................... #
 
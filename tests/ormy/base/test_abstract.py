@@ -0,0 +1,59 @@
+import unittest
+
+from ormy.base.abc import AbstractABC, ConfigABC
+
+# ----------------------- #
+
+
+class FirstConfig(ConfigABC):
+    name: str = "first"
+
+    def is_default(self) -> bool:
+        return self._default_helper("name")
+
+
+# ....................... #
+
+
+class SecondConfig(ConfigABC):
+    name: str = "second"
+
+    def is_default(self) -> bool:
+        return self._default_helper("name")
+
+
+# ----------------------- #
+
+
+class TestAbstract(unittest.TestCase):
+    def test_get_config_after_in_place_change(self):
+        class Model(AbstractABC):
+            configs = [FirstConfig(name="a")]
+
+        self.assertEqual(
+            Model.get_config(type_=FirstConfig).name,
+            "a",
+            "Config should be found by type",
+        )
+
+        Model.configs.append(SecondConfig(name="b"))
+
+        self.assertEqual(
+            Model.get_config(type_=SecondConfig).name,
+            "b",
+            "Appended config should be found",
+        )
+
+        Model.configs[0] = FirstConfig(name="c")
+
+        self.assertEqual(
+            Model.get_config(type_=FirstConfig).name,
+            "c",
+            "Replaced config should be found",
+        )
+
+
+# ----------------------- #
+
+if __name__ == "__main__":
+    unittest.main()
@@ -0,0 +1,221 @@
+import unittest
+from typing import Any, ClassVar, Dict, List, Optional
+
+from pydantic import BaseModel, ValidationError, model_validator
+
+from ormy.base.abc import DocumentABC
+
+# ----------------------- #
+
+
+class Address(BaseModel):
+    city: str = ""
+
+
+class AddressPatch(BaseModel):
+    city: str = ""
+
+
+class MemoryDocument(DocumentABC):
+    _store: ClassVar[Dict[Any, Dict[str, Any]]] = {}
+
+    name: str = ""
+    address: Address = Address()
+
+    @classmethod
+    def create(cls, data):
+        cls._store[data.id] = data.model_dump()
+        return data
+
+    @classmethod
+    async def acreate(cls, data):
+        return cls.create(data)
+
+    def save(self):
+        self._store[self.id] = self.model_dump()
+        return self
+
+    async def asave(self):
+        return self.save()
+
+    @classmethod
+    def find(cls, id_, *args, **kwargs):
+        if (row := cls._store.get(id_)) is not None:
+            return cls(**row)
+
+        return None
+
+    @classmethod
+    async def afind(cls, id_, *args, **kwargs):
+        return cls.find(id_)
+
+
+# ....................... #
+
+
+class PartialDocument(MemoryDocument):
+    _supports_partial_update: ClassVar[bool] = True
+    _partial_writes: ClassVar[List[Any]] = []
+
+    @classmethod
+    def _partial_update(cls, id_, updates):
+        if id_ not in cls._store:
+            return None
+
+        cls._store[id_].update(updates)
+        cls._partial_writes.append(id_)
+        return cls.find(id_)
+
+    @classmethod
+    async def _apartial_update(cls, id_, updates):
+        return cls._partial_update(id_, updates)
+
+
+# ....................... #
+
+
+class DefaultPartialDocument(MemoryDocument):
+    _supports_partial_update: ClassVar[bool] = True
+
+
+# ....................... #
+
+
+class RangeDocument(PartialDocument):
+    start: int
+    end: int
+
+    @model_validator(mode="after")
+    def check_range(self):
+        if self.end < self.start:
+            raise ValueError("end must not be before start")
+
+        return self
+
+
+# ----------------------- #
+
+
+class TestDocumentUpdate(unittest.TestCase):
+    def setUp(self):
+        MemoryDocument._store.clear()
+        PartialDocument._partial_writes.clear()
+        self.doc = MemoryDocument.create(MemoryDocument(name="a"))
+
+    # ....................... #
+
+    def test_update_with_foreign_nested_model(self):
+        class Patch(BaseModel):
+            name: Optional[str] = None
+            address: Optional[AddressPatch] = None
+
+        res = self.doc.update(Patch(address=AddressPatch(city="Paris")))
+
+        self.assertEqual(
+            res.address,
+            Address(city="Paris"),
+            "Nested patch model should be converted to the target field type",
+        )
+        self.assertEqual(
+            MemoryDocument._store[self.doc.id]["address"],
+            {"city": "Paris"},
+            "Updated document should be saved",
+        )
+
+    # ....................... #
+
+    def test_update_by_id_partial(self):
+        PartialDocument.create(PartialDocument(id="p", name="a"))
+        res = PartialDocument.update_by_id("p", {"name": "b"})
+
+        self.assertEqual(res.name, "b", "Partial update should apply the value")
+        self.assertIn(
+            "p",
+            PartialDocument._partial_writes,
+            "Model without validators should use the partial write",
+        )
+
+    # ....................... #
+
+    def test_update_by_id_default_partial(self):
+        DefaultPartialDocument.create(DefaultPartialDocument(id="d", name="a"))
+        res = DefaultPartialDocument.update_by_id("d", {"name": "b"})
+
+        self.assertEqual(res.name, "b", "Default partial update should apply the value")
+        self.assertEqual(
+            DefaultPartialDocument._store["d"]["name"],
+            "b",
+            "Default partial update should save the whole document",
+        )
+        self.assertIsNone(
+            DefaultPartialDocument.update_by_id("missing", {"name": "b"}),
+            "Missing document should return None",
+        )
+
+    # ....................... #
+
+    def test_update_by_id_with_model_validator(self):
+        RangeDocument.create(RangeDocument(id="r", start=1, end=5))
+        res = RangeDocument.update_by_id("r", {"end": 3})
+
+        self.assertEqual(res.end, 3, "Valid update should be applied")
+        self.assertNotIn(
+            "r",
+            RangeDocument._partial_writes,
+            "Model with validators should update the whole document",
+        )
+
+        with self.assertRaises(ValidationError):
+            RangeDocument.update_by_id("r", {"end": 0})
+
+
+# ----------------------- #
+
+
+class TestDocumentBulkUpdate(unittest.IsolatedAsyncioTestCase):
+    def setUp(self):
+        MemoryDocument._store.clear()
+        PartialDocument._partial_writes.clear()
+        PartialDocument.create(PartialDocument(id="a", name="a"))
+        PartialDocument.create(PartialDocument(id="b", name="b"))
+
+    # ....................... #
+
+    def test_bulk_update(self):
+        res = PartialDocument.bulk_update(
+            [
+                ("a", {"name": "a1"}),
+                ("missing", {"name": "x"}),
+                ("a", {"name": None, "address": {"city": "Rome"}}),
+            ]
+        )
+
+        self.assertEqual(len(res), 2, "Duplicate IDs should be updated once")
+        self.assertEqual(res[0].name, "a1", "Later None values should be ignored")
+        self.assertEqual(res[0].address.city, "Rome", "Updates should be merged")
+        self.assertIsNone(res[1], "Missing documents should return None")
+        self.assertEqual(
+            PartialDocument._partial_writes,
+            ["a"],
+            "Bulk update should use one partial write per found document",
+        )
+
+    # ....................... #
+
+    async def test_abulk_update(self):
+        res = await PartialDocument.abulk_update(
+            [("a", {"name": "a1"}), ("b", {"name": "b1"}), ("a", {"name": "a2"})]
+        )
+
+        self.assertEqual([x.name for x in res], ["a2", "b1"])
+        self.assertEqual(
+            [PartialDocument._store[x]["name"] for x in "ab"],
+            ["a2", "b1"],
+            "Updated documents should be saved",
+        )
+
+
+# ----------------------- #
+
+if __name__ == "__main__":
+    unittest.main()
@@ -89,6 +89,11 @@ class TestFunc(unittest.TestCase):
             hash_from_any(val_dict),
             "hash_from_any should return different hashes for different inputs",
         )
+        self.assertEqual(
+            hash_from_any({"a": 1, "b": 2}),
+            hash_from_any({"b": 2, "a": 1}),
+            "hash_from_any should not depend on dict key order",
+        )
 
     # ....................... #
 
@@ -1,6 +1,7 @@
 import unittest
+from typing import Annotated, Any, Dict, List, Mapping, Optional
 
-from pydantic import SecretStr
+from pydantic import AfterValidator, Field, PlainSerializer, SecretStr
 
 from ormy.base.pydantic import Base
 
@@ -47,6 +48,60 @@ class TestPydantic(unittest.TestCase):
 
     # ....................... #
 
+    def test_model_flat_schema_cached(self):
+        class TestModel(Base):
+            a: int
+            created_at: int
+
+        first = TestModel.model_flat_schema()
+        second = TestModel.model_flat_schema()
+
+        self.assertEqual(
+            first,
+            second,
+            "Repeated flat schema calls should return the same schema",
+        )
+        self.assertIs(
+            TestModel._serialization_schema(),
+            TestModel._serialization_schema(),
+            "Serialization schema should be built once per class",
+        )
+
+    # ....................... #
+
+    def test_model_reference_extra_definitions(self):
+        class TestModel(Base):
+            a: int
+
+        extra_definitions = [
+            {"key": "status", "title": "Status", "value": ["new", "done"]},
+        ]
+
+        ref = TestModel.model_reference(
+            extra=["status"],
+            extra_definitions=extra_definitions,
+        )
+
+        self.assertEqual(
+            [x["key"] for x in ref.table_schema],
+            ["a", "status"],
+            "Reference should include extra fields with list values",
+        )
+
+        prefixed = TestModel.model_reference(
+            extra=["status"],
+            extra_definitions=extra_definitions,
+            prefix="p",
+        )
+
+        self.assertEqual(
+            [x["key"] for x in prefixed.table_schema],
+            ["p_a"],
+            "Prefixed reference should drop extra fields",
+        )
+
+    # ....................... #
+
     def test_handle_secret(self):
         secret = SecretStr("secret_value")
         self.assertNotEqual(
@@ -91,6 +146,96 @@ class TestPydantic(unittest.TestCase):
 
     # ....................... #
 
+    def test_has_secrets(self):
+        class Nested(Base):
+            secret_field: Optional[SecretStr] = None
+
+        class WithSecrets(Base):
+            nested: Nested = Nested()
+
+        class WithoutSecrets(Base):
+            normal_field: List[str] = []
+
+        self.assertTrue(
+            WithSecrets._has_secrets(),
+            "Model with nested secret field should have secrets",
+        )
+        self.assertFalse(
+            WithoutSecrets._has_secrets(),
+            "Model without secret fields should not have secrets",
+        )
+
+        for annotation in (Dict, List, Mapping, dict, list, Any, Optional[Dict]):
+
+            class Untyped(Base):
+                value: annotation = None  # type: ignore[valid-type]
+
+            self.assertTrue(
+                Untyped._has_secrets(),
+                f"Model with {annotation} field may hold secrets",
+            )
+        self.assertEqual(
+            WithSecrets(
+                nested=Nested(secret_field=SecretStr("secret"))
+            ).model_dump_with_secrets(),
+            {"nested": {"secret_field": "secret"}},
+            "Nested secret field should be revealed",
+        )
+
+    # ....................... #
+
+    def test_has_plain_fields(self):
+        class Plain(Base):
+            name: str = "plain"
+            count: Optional[int] = None
+
+        class WithList(Base):
+            items: List[str] = []
+
+        class WithSecret(Base):
+            secret_field: Optional[SecretStr] = None
+
+        class WithSerializer(Base):
+            name: Annotated[str, PlainSerializer(str.upper)] = "plain"
+
+        class WithValidator(Base):
+            name: Annotated[str, AfterValidator(str.upper)] = "plain"
+
+        class WithConstraint(Base):
+            count: int = Field(default=0, ge=0)
+
+        self.assertTrue(
+            Plain._has_plain_fields(),
+            "Model with scalar fields should have plain fields",
+        )
+        self.assertFalse(
+            WithList._has_plain_fields(),
+            "Model with container fields should not have plain fields",
+        )
+        self.assertFalse(
+            WithSecret._has_plain_fields(),
+            "Model with secret fields should not have plain fields",
+        )
+        self.assertFalse(
+            WithSerializer._has_plain_fields(),
+            "Model with annotated serializer should not have plain fields",
+        )
+        self.assertFalse(
+            WithValidator._has_plain_fields(),
+            "Model with annotated validator should not have plain fields",
+        )
+        self.assertTrue(
+            WithConstraint._has_plain_fields(),
+            "Model with constrained scalar fields should have plain fields",
+        )
+        self.assertEqual(
+            dict(Plain(count=1).__dict__),
+            Plain(count=1).model_dump(),
+            "Raw field values of plain model should match its dump",
+        )
+
+    # ....................... #
+
     def test_define_dtype(self):
         self.assertEqual(
             Base._define_dtype("created_at"),
@@ -0,0 +1,141 @@
+import asyncio
+import unittest
+from unittest import mock
+
+from pydantic import ValidationError
+
+from ormy.extension.meilisearch import MeilisearchConfig, MeilisearchExtension
+from ormy.extension.meilisearch.func import meili_attributes_to_retrieve
+
+# ----------------------- #
+
+
+class QueuedDocument(MeilisearchExtension):
+    configs = [
+        MeilisearchConfig(
+            index="queued_document",
+            debounce_sec=60,
+            batch_size=3,
+            include_to_registry=False,
+        )
+    ]
+
+    id: str
+
+
+# ----------------------- #
+
+
+class TestMeilisearchQueue(unittest.IsolatedAsyncioTestCase):
+    async def asyncSetUp(self):
+        self.sent = []
+
+        async def _update(docs):
+            await asyncio.sleep(0)
+            self.sent.append([d.id for d in docs])
+
+        patcher = mock.patch.object(
+            QueuedDocument,
+            "ameili_update_documents",
+            side_effect=_update,
+        )
+        patcher.start()
+        self.addCleanup(patcher.stop)
+
+    # ....................... #
+
+    async def test_flush_sends_queued_documents(self):
+        QueuedDocument.ameili_queue_documents(QueuedDocument(id="a"))
+        QueuedDocument.ameili_queue_documents([QueuedDocument(id="b")])
+
+        self.assertEqual(self.sent, [], "Queued documents should wait for debounce")
+
+        await QueuedDocument.ameili_flush()
+
+        self.assertEqual(
+            self.sent,
+            [["a", "b"]],
+            "Flush should send queued documents together",
+        )
+
+        await QueuedDocument.ameili_flush()
+
+        self.assertEqual(self.sent, [["a", "b"]], "Flush should send documents once")
+
+    # ....................... #
+
+    async def test_queue_sends_full_batch(self):
+        QueuedDocument.ameili_queue_documents(
+            [QueuedDocument(id=x) for x in ("a", "b", "c", "d")]
+        )
+        await QueuedDocument.ameili_flush()
+
+        self.assertEqual(
+            self.sent,
+            [["a", "b", "c", "d"]],
+            "Full queue should be sent without waiting for debounce",
+        )
+
+
+# ....................... #
+
+
+class TestMeilisearchEnsureIndex(unittest.IsolatedAsyncioTestCase):
+    async def test_index_created_once(self):
+        class IndexedDocument(MeilisearchExtension):
+            configs = [
+                MeilisearchConfig(
+                    index="indexed_document",
+                    include_to_registry=False,
+                )
+            ]
+
+        with mock.patch.object(
+            IndexedDocument,
+            "_meili_safe_create_or_update",
+        ) as create:
+            await asyncio.gather(
+                *(IndexedDocument._ameili_ensure_index() for _ in range(4))
+            )
+            IndexedDocument._meili_ensure_index()
+
+        create.assert_called_once_with()
+
+
+# ....................... #
+
+
+class TestMeilisearchAttributes(unittest.TestCase):
+    def test_attributes_are_not_shared(self):
+        attributes = meili_attributes_to_retrieve(QueuedDocument, exclude=["other"])
+        attributes.append("extra")
+
+        self.assertEqual(
+            meili_attributes_to_retrieve(QueuedDocument, exclude=["other"]),
+            ["id"],
+            "Changing returned attributes should not affect later requests",
+        )
+
+
+# ....................... #
+
+
+class TestMeilisearchConfig(unittest.TestCase):
+    def test_batch_size_must_be_positive(self):
+        for batch_size in (0, -1):
+            with self.assertRaises(ValidationError):
+                MeilisearchConfig(batch_size=batch_size)
+
+    # ....................... #
+
+    def test_debounce_must_not_be_negative(self):
+        with self.assertRaises(ValidationError):
+            MeilisearchConfig(debounce_sec=-1)
+
+        self.assertEqual(MeilisearchConfig(debounce_sec=0).debounce_sec, 0)
+
+
+# ----------------------- #
+
+if __name__ == "__main__":
+    unittest.main()
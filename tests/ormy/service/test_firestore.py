@@ -1,7 +1,9 @@
 import os
 import unittest
+from unittest import mock
 
 import firebase_admin  # type: ignore
+from google.auth.credentials import AnonymousCredentials
 
 from ormy.service.firestore import (
     FirestoreBase,
@@ -23,6 +25,32 @@ credentials = FirestoreCredentials(
     app=app,
 )
 
+
+class EmulatorCredential(firebase_admin.credentials.Base):
+    def get_credential(self):
+        return AnonymousCredentials()
+
+
+try:
+    clients_app = firebase_admin.get_app(name="clients")
+
+except ValueError:
+    clients_app = firebase_admin.initialize_app(
+        credential=EmulatorCredential(),
+        options={"projectId": "test-project"},
+        name="clients",
+    )
+
+try:
+    second_app = firebase_admin.get_app(name="second")
+
+except ValueError:
+    second_app = firebase_admin.initialize_app(
+        credential=EmulatorCredential(),
+        options={"projectId": "test-project-2"},
+        name="second",
+    )
+
 # ----------------------- #
 
 
@@ -209,6 +237,99 @@ class TestFirestoreBaseAsync(unittest.IsolatedAsyncioTestCase):
         )
 
 
+# ----------------------- #
+
+
+class TestFirestoreClients(unittest.IsolatedAsyncioTestCase):
+    @classmethod
+    def setUpClass(cls):
+        class Base1(FirestoreBase):
+            configs = [
+                FirestoreConfig(
+                    credentials=FirestoreCredentials(app=clients_app),
+                    collection="clients_firestore",
+                ),
+            ]
+
+        class Base2(Base1):
+            configs = [
+                FirestoreConfig(database="second-db"),
+            ]
+
+        class Base3(Base2):
+            configs = [
+                FirestoreConfig(credentials=FirestoreCredentials(app=second_app)),
+            ]
+
+        class Base4(Base3):
+            configs = [
+                FirestoreConfig(
+                    credentials=FirestoreCredentials(
+                        app=second_app,
+                        project_id="test-project-3",
+                    ),
+                ),
+            ]
+
+        cls.bases = [Base1, Base2, Base3, Base4]
+        cls.expected = [
+            ("test-project", "(default)"),
+            ("test-project", "second-db"),
+            ("test-project-2", "second-db"),
+            ("test-project-3", "second-db"),
+        ]
+
+    # ....................... #
+
+    def test_client(self):
+        for base, expected in zip(self.bases, self.expected):
+            client = base._get_client()
+
+            self.assertEqual(
+                (client.project, client._database),
+                expected,
+                f"{base.__name__} client should use its own project and database",
+            )
+            self.assertIs(
+                base._get_client(),
+                client,
+                f"{base.__name__} client should be reused",
+            )
+
+    # ....................... #
+
+    def test_collection_reads_config_once(self):
+        base = self.bases[-1]
+        base._get_collection()
+
+        with mock.patch.object(base, "get_config") as get_config:
+            collection = base._get_collection()
+
+        get_config.assert_not_called()
+        self.assertEqual(
+            collection.id,
+            "clients_firestore",
+            "Collection should be inherited from the parent config",
+        )
+
+    # ....................... #
+
+    async def test_aclient(self):
+        for base, expected in zip(self.bases, self.expected):
+            client = base._aget_client()
+
+            self.assertEqual(
+                (client.project, client._database),
+                expected,
+                f"{base.__name__} async client should use its own project and database",
+            )
+            self.assertIs(
+                base._aget_client(),
+                client,
+                f"{base.__name__} async client should be reused on the same loop",
+            )
+
+
 # ----------------------- #
 
 if __name__ == "__main__":